@@ -3,11 +3,6 @@
 Example: Network connection to OWON PSU
 Demonstrates how to connect to an OWON PSU via network and perform basic operations.
 """
-import os
-import sys
-
-# Add the parent directory to the Python path to access the owon_psu module
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
 from owon_psu import OwonPSU, OwonPSUError
 
@@ -35,9 +30,10 @@ def main():
         # Configure output
         print("\n--- Configuring Output ---")
         psu.configure_output(voltage=12.0, current=1.0, enable=True)
-        print(f"Set Voltage: {psu.get_voltage()}V")
-        print(f"Set Current: {psu.get_current()}A")
-        print(f"Output Enabled: {psu.get_output()}")
+        status = psu.get_measurement_status()
+        print(f"Set Voltage: {status['set_voltage']}V")
+        print(f"Set Current: {status['set_current']}A")
+        print(f"Output Enabled: {status['output_enabled']}")
         
         # Monitor measurements
         print("\n--- Monitoring Measurements ---")
@@ -54,8 +50,9 @@ def main():
         print("--- Changing Settings ---")
         psu.set_voltage(15.0)
         psu.set_current(0.5)
-        print(f"New Voltage: {psu.get_voltage()}V")
-        print(f"New Current: {psu.get_current()}A")
+        status = psu.get_measurement_status()
+        print(f"New Voltage: {status['set_voltage']}V")
+        print(f"New Current: {status['set_current']}A")
         
         # Safe shutdown
         print("\n--- Safe Shutdown ---")
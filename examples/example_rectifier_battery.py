@@ -7,28 +7,144 @@ Includes multi-stage charging, monitoring, and safety features.
 Author: Robbe Derks
 Version: 1.0.0
 """
-import os
-import sys
 import time
+import asyncio
+import collections
+import contextlib
+import functools
 import logging
+import logging.handlers
+import signal
+import threading
 from datetime import datetime, timedelta
 
-# Add the parent directory to the Python path to access the owon_psu module
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# Configure logging (before importing owon_psu, whose own basicConfig would
+# otherwise take precedence and leave the log file unused)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 
-from owon_psu import OwonPSU, OwonPSUError
+# Buffer log file writes: flush every 64 records, or at once on warnings/errors
+_log_file_handler = logging.FileHandler('battery_charging.log')
+_log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('battery_charging.log'),
+        logging.handlers.MemoryHandler(
+            capacity=64,
+            flushLevel=logging.WARNING,
+            target=_log_file_handler
+        ),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+from owon_psu import OwonPSU, OwonPSUError, available_serial_ports
+
+NS_PER_HOUR = 3600 * 10**9
+
+# Per-stage monitoring behaviour, see GelAccumulatorCharger._monitor_stage()
+StageConfig = collections.namedtuple('StageConfig', [
+    'label',            # Name used in progress logs
+    'interval',         # Nominal poll interval in seconds
+    'duration_attr',    # Charger attribute holding the stage length in ns, or None
+    'exit_on_voltage',  # Stage ends at absorption voltage (decided by a Monitor)
+    'exit_on_current',  # Stage ends at termination current
+    'next_action',      # Charger coroutine method run when the stage ends
+])
+
+STAGES = {
+    'bulk': StageConfig('Bulk', 30, None, True, False, '_start_absorption_charging'),
+    'absorption': StageConfig('Absorption', 60, '_absorption_ns', False, True, '_start_float_charging'),
+    'float': StageConfig('Float', 120, '_float_ns', False, False, '_complete_charging'),
+}
+
+class Monitor:
+    """
+    One-directional monitor control node.
+    
+    Runs ``task`` while periodically evaluating ``test``. The first time the
+    test holds, the task is cancelled and ``recovery`` is awaited to
+    completion; control never returns to the task afterwards. If the task
+    finishes on its own, the recovery is not run.
+    """
+    
+    def __init__(self, test, recovery, task, poll_interval: float = 1.0):
+        """
+        Initialize the monitor node.
+        
+        Args:
+            test: Cheap synchronous callable returning True to interrupt the task
+            recovery: Coroutine function run once the test holds
+            task: Coroutine function supervised by the monitor
+            poll_interval: Seconds between test evaluations
+        """
+        self.test = test
+        self.recovery = recovery
+        self.task = task
+        self.poll_interval = poll_interval
+    
+    async def run(self) -> bool:
+        """
+        Run the task under supervision.
+        
+        Returns:
+            True if the test fired and the recovery ran, False otherwise
+        """
+        running = asyncio.ensure_future(self.task())
+        try:
+            while True:
+                await asyncio.wait({running}, timeout=self.poll_interval)
+                if running.done():
+                    running.result()
+                    return False
+                if self.test():
+                    running.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await running
+                    await self.recovery()
+                    return True
+        finally:
+            running.cancel()
+
+class PerformanceObserver:
+    """Records per-tick query latency and chosen poll interval for later tuning."""
+    
+    def __init__(self, max_samples: int = 1000):
+        """
+        Initialize the observer.
+        
+        Args:
+            max_samples: Number of most recent ticks to keep
+        """
+        self.samples = collections.deque(maxlen=max_samples)
+    
+    def record(self, stage: str, query_duration: float, interval: float):
+        """Record one monitor tick."""
+        self.samples.append((stage, query_duration, interval))
+    
+    def summary(self) -> dict:
+        """
+        Summarize recorded ticks per stage.
+        
+        Returns:
+            dict: Stage name -> tick count, mean query time and mean interval (s)
+        """
+        totals = {}
+        for stage, query_duration, interval in self.samples:
+            count, query_sum, interval_sum = totals.get(stage, (0, 0.0, 0.0))
+            totals[stage] = (count + 1, query_sum + query_duration, interval_sum + interval)
+        
+        return {
+            stage: {
+                "ticks": count,
+                "mean_query_s": query_sum / count,
+                "mean_interval_s": interval_sum / count
+            }
+            for stage, (count, query_sum, interval_sum) in totals.items()
+        }
+
 class GelAccumulatorCharger:
     """
     Gel Accumulator Charging Controller
@@ -37,6 +153,12 @@ class GelAccumulatorCharger:
     using an OWON PSU as the power source.
     """
     
+    # Adaptive poll interval bounds as multiples of each stage's nominal interval;
+    # never above 1, since every sample also feeds the safety checks
+    POLL_RANGE = (0.2, 1.0)
+    # Fraction of the predicted time-to-threshold to wait before the next sample
+    POLL_GAIN = 0.5
+    
     def __init__(self, psu: OwonPSU, battery_specs: dict):
         """
         Initialize the battery charger.
@@ -48,8 +170,23 @@ class GelAccumulatorCharger:
         self.psu = psu
         self.battery_specs = battery_specs
         self.charging_stage = "idle"
-        self.start_time = None
-        self.stage_start_time = None
+        self._start_ns = None
+        self._stage_start_ns = None
+        self.started_at = None
+        
+        # Set on every stage transition; see stage_updates()
+        self.stage_changed = asyncio.Event()
+        
+        self._last_voltage = None
+        self._prev_sample = None
+        self.observer = PerformanceObserver()
+        
+        # Serializes blocking PSU calls issued from concurrent tasks
+        self._io_lock = threading.Lock()
+        
+        # Set by request_stop(); the task running run() is cancelled
+        self._stop_requested = False
+        self._task = None
         
         # Validate battery specifications
         self._validate_battery_specs()
@@ -94,285 +231,421 @@ class GelAccumulatorCharger:
             'safety_timeout': capacity * 2  # Hours, maximum charging time
         }
         
+        # Stage durations as integer nanoseconds for monotonic_ns() comparisons
+        self._absorption_ns = int(self.charge_params['absorption_time'] * NS_PER_HOUR)
+        self._float_ns = int(self.charge_params['float_time'] * NS_PER_HOUR)
+        self._safety_timeout_ns = int(self.charge_params['safety_timeout'] * NS_PER_HOUR)
+        
+        # Thresholds read on every monitoring tick
+        self._absorption_v = self.charge_params['absorption_voltage']
+        self._termination_i = self.charge_params['termination_current']
+        
+        # Safe operating window as (min_v, max_v, min_i, max_i); currents
+        # below min_i only warn since some discharge is normal in float
+        self._safety_bounds = (
+            self.battery_specs['min_voltage'],
+            self.charge_params['bulk_voltage'] + 1.0,
+            -0.1,
+            self.charge_params['max_current'] * 1.1,
+        )
+        
         logger.info(f"Charging parameters initialized:")
         logger.info(f"  Bulk voltage: {self.charge_params['bulk_voltage']:.2f}V")
         logger.info(f"  Absorption voltage: {self.charge_params['absorption_voltage']:.2f}V")
         logger.info(f"  Float voltage: {self.charge_params['float_voltage']:.2f}V")
         logger.info(f"  Max current: {self.charge_params['max_current']:.2f}A")
     
-    def start_charging(self):
+    async def _call(self, func, *args, **kwargs):
+        """
+        Run a blocking PSU call without stalling the event loop.
+        
+        The call is executed in the default executor; calls on the same PSU
+        are serialized by a threading.Lock taken in the executor thread, so
+        SCPI request/response pairs never interleave, even when the awaiting
+        task is cancelled mid-call.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self._locked_call, func, *args, **kwargs))
+    
+    def _locked_call(self, func, *args, **kwargs):
+        """Invoke a PSU call while holding the I/O lock (executor thread)."""
+        with self._io_lock:
+            return func(*args, **kwargs)
+    
+    async def _sample(self):
+        """
+        Take one measurement and record how long the query took.
+        
+        Returns:
+            tuple: (status dict, query duration in seconds)
+        """
+        started = time.perf_counter()
+        status = await self._call(self.psu.get_measurement_status)
+        return status, time.perf_counter() - started
+    
+    def _adaptive_interval(self, value: float, target: float, nominal: float) -> float:
+        """
+        Pick the next poll interval from how fast a value approaches its threshold.
+        
+        The rate is estimated from the last two samples of the current stage.
+        Polling speeds up close to the threshold, down to POLL_RANGE[0] times
+        ``nominal``; a flat or receding value is sampled at the nominal rate,
+        so the safety checks never run less often than the stage specifies.
+        
+        Args:
+            value: Latest sampled value
+            target: Threshold that ends the stage
+            nominal: Nominal poll interval of the stage in seconds
+        
+        Returns:
+            float: Seconds to wait before the next sample
+        """
+        now = time.monotonic()
+        previous, self._prev_sample = self._prev_sample, (now, value)
+        min_interval, max_interval = (factor * nominal for factor in self.POLL_RANGE)
+        if previous is None:
+            return nominal
+        
+        dt = now - previous[0]
+        # Positive when moving towards the target
+        approach = (value - previous[1]) if target > value else (previous[1] - value)
+        if dt <= 0 or approach <= 0:
+            return max_interval
+        
+        interval = self.POLL_GAIN * abs(target - value) / (approach / dt)
+        return min(max_interval, max(min_interval, interval))
+    
+    async def start_charging(self):
         """Start the battery charging process."""
         logger.info("=== Starting Gel Accumulator Charging Process ===")
         logger.info(f"Battery: {self.battery_specs['nominal_voltage']}V, {self.battery_specs['capacity_ah']}Ah")
         
+        watchdog = None
         try:
-            # Set start time
-            self.start_time = time.time()
+            # Set start time (monotonic_ns for elapsed math, wall clock for display)
+            self._start_ns = time.monotonic_ns()
+            self.started_at = datetime.now()
             
-            # Reset PSU to known state
-            self.psu.reset()
-            time.sleep(1)
+            # Reset PSU to known state and configure limits in one write,
+            # then wait for the reset to finish instead of a fixed delay
+            await self._call(self.psu.write_many, [
+                "*RST",
+                f"VOLTage:LIMit {self.charge_params['bulk_voltage'] + 1.0:.3f}",
+                f"CURRent:LIMit {self.charge_params['max_current']:.3f}",
+            ])
+            await self._call(self.psu.wait_for_opc, 5.0)
             
-            # Configure PSU for charging
-            self.psu.set_voltage_limit(self.charge_params['bulk_voltage'] + 1.0)
-            self.psu.set_current_limit(self.charge_params['max_current'])
+            # Enforce the overall charging timeout alongside the stage monitors
+            watchdog = asyncio.create_task(self._safety_watchdog())
             
             # Start with bulk charging
-            self._start_bulk_charging()
+            await self._start_bulk_charging()
             
-        except Exception as e:
-            logger.error(f"Failed to start charging: {e}")
-            self._emergency_shutdown()
-            raise
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+    
+    async def run(self) -> str:
+        """
+        Run the complete charging pipeline.
+        
+        Any way out of the pipeline other than normal completion (errors,
+        request_stop()) ends in an emergency shutdown of the PSU output.
+        
+        Returns:
+            str: Final charging stage ("complete" or "emergency")
+        """
+        self._task = asyncio.current_task()
+        try:
+            await self.start_charging()
+        except asyncio.CancelledError:
+            if not self._stop_requested:
+                raise
+            logger.warning("Charging interrupted by user")
+        finally:
+            self._task = None
+            if self.charging_stage not in ["complete", "emergency"]:
+                await self._emergency_shutdown()
+        return self.charging_stage
+    
+    def request_stop(self):
+        """Stop charging and shut the output down (safe to call from a signal handler)."""
+        self._stop_requested = True
+        if self._task is not None:
+            self._task.cancel()
     
-    def _start_bulk_charging(self):
+    async def _safety_watchdog(self):
+        """Shut down if the whole charge exceeds the safety timeout."""
+        await asyncio.sleep(self.charge_params['safety_timeout'] * 3600)
+        if self.charging_stage not in ["complete", "emergency"]:
+            logger.error("Safety timeout reached during charging")
+            await self._emergency_shutdown()
+    
+    async def _start_bulk_charging(self):
         """Start bulk charging stage."""
-        self.charging_stage = "bulk"
-        self.stage_start_time = time.time()
+        self._enter_stage("bulk")
         
         logger.info("--- Starting Bulk Charging Stage ---")
         logger.info(f"Target voltage: {self.charge_params['bulk_voltage']:.2f}V")
         logger.info(f"Current limit: {self.charge_params['max_current']:.2f}A")
         
         # Set PSU to bulk charging parameters
-        self.psu.configure_output(
+        await self._call(
+            self.psu.configure_output,
             voltage=self.charge_params['bulk_voltage'],
             current=self.charge_params['max_current'],
             enable=True
         )
         
-        # Monitor bulk charging
-        self._monitor_bulk_charging()
+        # Monitor bulk charging; leaving the stage is a one-way transition
+        await Monitor(
+            test=self._bulk_complete,
+            recovery=self._start_absorption_charging,
+            task=functools.partial(self._monitor_stage, "bulk")
+        ).run()
     
-    def _monitor_bulk_charging(self):
-        """Monitor bulk charging stage."""
-        logger.info("Monitoring bulk charging...")
+    def _bulk_complete(self) -> bool:
+        """
+        Check whether the bulk stage is done, using the last sampled voltage.
         
-        while self.charging_stage == "bulk":
-            try:
-                # Get current measurements
-                status = self.psu.get_measurement_status()
-                voltage = status['voltage']
-                current = status['current']
-                power = status['power']
-                
-                # Log progress
-                elapsed = time.time() - self.stage_start_time
-                logger.info(f"Bulk: {elapsed/3600:.1f}h - V: {voltage:.3f}V, I: {current:.3f}A, P: {power:.2f}W")
-                
-                # Check if ready to transition to absorption
-                if voltage >= self.charge_params['absorption_voltage']:
-                    logger.info("Bulk charging complete, transitioning to absorption stage")
-                    self._start_absorption_charging()
-                    break
-                
-                # Check safety conditions
-                if self._check_safety_conditions(voltage, current):
-                    break
-                
-                # Check timeout
-                if elapsed > self.charge_params['safety_timeout'] * 3600:
-                    logger.warning("Bulk charging timeout reached")
-                    self._start_absorption_charging()
-                    break
-                
-                time.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                logger.error(f"Error during bulk charging: {e}")
-                self._emergency_shutdown()
+        Returns:
+            True if absorption voltage or the bulk timeout has been reached
+        """
+        if self.charging_stage != "bulk":
+            return False
+        
+        if self._last_voltage is not None and self._last_voltage >= self._absorption_v:
+            logger.info("Bulk charging complete, transitioning to absorption stage")
+            return True
+        
+        if time.monotonic_ns() - self._stage_start_ns > self._safety_timeout_ns:
+            logger.warning("Bulk charging timeout reached")
+            return True
+        
+        return False
+    
+    async def _monitor_stage(self, stage: str):
+        """
+        Monitor a charging stage as described by its STAGES entry.
+        
+        Args:
+            stage: Key into STAGES; monitoring stops when the stage is left
+        """
+        cfg = STAGES[stage]
+        logger.info("Monitoring %s charging...", stage)
+        
+        # Bind per-stage constants once so the loop only reads locals
+        monotonic_ns = time.monotonic_ns
+        stage_start_ns = self._stage_start_ns
+        duration_ns = getattr(self, cfg.duration_attr) if cfg.duration_attr else None
+        termination_i = self._termination_i
+        exit_on_voltage = cfg.exit_on_voltage
+        exit_on_current = cfg.exit_on_current
+        absorption_v = self._absorption_v
+        nominal = cfg.interval
+        
+        while self.charging_stage == stage and not self._stop_requested:
+            # Get current measurements
+            status, query_duration = await self._sample()
+            voltage = status['voltage']
+            current = status['current']
+            power = status['power']
+            
+            # Log progress
+            elapsed_ns = monotonic_ns() - stage_start_ns
+            remaining_ns = duration_ns - elapsed_ns if duration_ns is not None else None
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s: %.1fh - V: %.3fV, I: %.3fA, P: %.2fW",
+                            cfg.label, elapsed_ns / NS_PER_HOUR, voltage, current, power)
+                if remaining_ns is not None:
+                    logger.info("  Time remaining: %.1fh", remaining_ns / NS_PER_HOUR)
+            
+            # Check if the stage time is complete
+            if remaining_ns is not None and remaining_ns <= 0:
+                logger.info("%s charging complete", cfg.label)
+                await getattr(self, cfg.next_action)()
+                break
+            
+            # Check if current has dropped to termination level
+            if exit_on_current and current <= termination_i:
+                logger.info("Termination current reached, leaving %s stage", stage)
+                await getattr(self, cfg.next_action)()
                 break
+            
+            # Check safety conditions
+            if await self._check_safety_conditions(voltage, current):
+                break
+            
+            # Voltage-based transitions are decided by the stage monitor
+            self._last_voltage = voltage
+            
+            # Poll faster when nearing the exit threshold, and never
+            # sleep past the end of a time-limited stage
+            if exit_on_voltage:
+                interval = self._adaptive_interval(voltage, absorption_v, nominal)
+            elif exit_on_current:
+                interval = self._adaptive_interval(current, termination_i, nominal)
+            else:
+                interval = nominal
+            if remaining_ns is not None:
+                interval = max(1.0, min(interval, remaining_ns / 1e9))
+            self.observer.record(stage, query_duration, interval)
+            await asyncio.sleep(interval)
     
-    def _start_absorption_charging(self):
+    async def _start_absorption_charging(self):
         """Start absorption charging stage."""
-        self.charging_stage = "absorption"
-        self.stage_start_time = time.time()
+        self._enter_stage("absorption")
         
         logger.info("--- Starting Absorption Charging Stage ---")
         logger.info(f"Target voltage: {self.charge_params['absorption_voltage']:.2f}V")
         logger.info(f"Duration: {self.charge_params['absorption_time']:.1f} hours")
         
         # Set PSU to absorption voltage
-        self.psu.set_voltage(self.charge_params['absorption_voltage'])
+        await self._call(self.psu.set_voltage, self.charge_params['absorption_voltage'])
         
         # Monitor absorption charging
-        self._monitor_absorption_charging()
+        await self._monitor_stage("absorption")
     
-    def _monitor_absorption_charging(self):
-        """Monitor absorption charging stage."""
-        logger.info("Monitoring absorption charging...")
-        
-        while self.charging_stage == "absorption":
-            try:
-                # Get current measurements
-                status = self.psu.get_measurement_status()
-                voltage = status['voltage']
-                current = status['current']
-                power = status['power']
-                
-                # Log progress
-                elapsed = time.time() - self.stage_start_time
-                remaining = self.charge_params['absorption_time'] - elapsed/3600
-                logger.info(f"Absorption: {elapsed/3600:.1f}h - V: {voltage:.3f}V, I: {current:.3f}A, P: {power:.2f}W")
-                logger.info(f"  Time remaining: {remaining:.1f}h")
-                
-                # Check if absorption time is complete
-                if elapsed >= self.charge_params['absorption_time'] * 3600:
-                    logger.info("Absorption charging complete, transitioning to float stage")
-                    self._start_float_charging()
-                    break
-                
-                # Check if current has dropped to termination level
-                if current <= self.charge_params['termination_current']:
-                    logger.info("Termination current reached, transitioning to float stage")
-                    self._start_float_charging()
-                    break
-                
-                # Check safety conditions
-                if self._check_safety_conditions(voltage, current):
-                    break
-                
-                time.sleep(60)  # Check every minute
-                
-            except Exception as e:
-                logger.error(f"Error during absorption charging: {e}")
-                self._emergency_shutdown()
-                break
-    
-    def _start_float_charging(self):
+    async def _start_float_charging(self):
         """Start float charging stage."""
-        self.charging_stage = "float"
-        self.stage_start_time = time.time()
+        self._enter_stage("float")
         
         logger.info("--- Starting Float Charging Stage ---")
         logger.info(f"Target voltage: {self.charge_params['float_voltage']:.2f}V")
         logger.info(f"Duration: {self.charge_params['float_time']:.1f} hours")
         
         # Set PSU to float voltage
-        self.psu.set_voltage(self.charge_params['float_voltage'])
+        await self._call(self.psu.set_voltage, self.charge_params['float_voltage'])
         
         # Monitor float charging
-        self._monitor_float_charging()
+        await self._monitor_stage("float")
     
-    def _monitor_float_charging(self):
-        """Monitor float charging stage."""
-        logger.info("Monitoring float charging...")
-        
-        while self.charging_stage == "float":
-            try:
-                # Get current measurements
-                status = self.psu.get_measurement_status()
-                voltage = status['voltage']
-                current = status['current']
-                power = status['power']
-                
-                # Log progress
-                elapsed = time.time() - self.stage_start_time
-                remaining = self.charge_params['float_time'] - elapsed/3600
-                logger.info(f"Float: {elapsed/3600:.1f}h - V: {voltage:.3f}V, I: {current:.3f}A, P: {power:.2f}W")
-                logger.info(f"  Time remaining: {remaining:.1f}h")
-                
-                # Check if float time is complete
-                if elapsed >= self.charge_params['float_time'] * 3600:
-                    logger.info("Float charging complete")
-                    self._complete_charging()
-                    break
-                
-                # Check safety conditions
-                if self._check_safety_conditions(voltage, current):
-                    break
-                
-                time.sleep(120)  # Check every 2 minutes
-                
-            except Exception as e:
-                logger.error(f"Error during float charging: {e}")
-                self._emergency_shutdown()
-                break
-    
-    def _check_safety_conditions(self, voltage: float, current: float) -> bool:
+    async def _check_safety_conditions(self, voltage: float, current: float) -> bool:
         """
         Check safety conditions during charging.
         
         Returns:
             True if safety condition violated, False otherwise
         """
+        min_v, max_v, min_i, max_i = self._safety_bounds
+        
+        # Fast path: everything within the window
+        if min_v <= voltage <= max_v and min_i <= current <= max_i:
+            return False
+        
         # Check voltage limits
-        if voltage > self.charge_params['bulk_voltage'] + 1.0:
-            logger.error(f"Voltage too high: {voltage:.3f}V")
-            self._emergency_shutdown()
+        if voltage > max_v:
+            logger.error("Voltage too high: %.3fV", voltage)
+            await self._emergency_shutdown()
             return True
         
-        if voltage < self.battery_specs['min_voltage']:
-            logger.error(f"Voltage too low: {voltage:.3f}V")
-            self._emergency_shutdown()
+        if voltage < min_v:
+            logger.error("Voltage too low: %.3fV", voltage)
+            await self._emergency_shutdown()
             return True
         
         # Check current limits
-        if current > self.charge_params['max_current'] * 1.1:
-            logger.error(f"Current too high: {current:.3f}A")
-            self._emergency_shutdown()
+        if current > max_i:
+            logger.error("Current too high: %.3fA", current)
+            await self._emergency_shutdown()
             return True
         
-        # Check for negative current (battery discharging)
-        if current < -0.1:
-            logger.warning(f"Battery discharging: {current:.3f}A")
-            # This might be normal during float stage, just log it
-        
+        # Negative current (battery discharging) might be normal during
+        # float stage, just log it
+        logger.warning("Battery discharging: %.3fA", current)
         return False
     
-    def _complete_charging(self):
+    async def _complete_charging(self):
         """Complete the charging process."""
-        self.charging_stage = "complete"
-        total_time = time.time() - self.start_time
+        self._enter_stage("complete")
+        total_time = (time.monotonic_ns() - self._start_ns) / 1e9
         
         logger.info("=== Charging Process Complete ===")
         logger.info(f"Total charging time: {total_time/3600:.1f} hours")
         
         # Get final measurements
-        status = self.psu.get_measurement_status()
+        status = await self._call(self.psu.get_measurement_status)
         logger.info(f"Final voltage: {status['voltage']:.3f}V")
         logger.info(f"Final current: {status['current']:.3f}A")
         logger.info(f"Final power: {status['power']:.2f}W")
         
+        if logger.isEnabledFor(logging.INFO):
+            for stage, stats in self.observer.summary().items():
+                logger.info("Polling %s: %d ticks, query %.1fms, interval %.1fs",
+                            stage, stats['ticks'], stats['mean_query_s'] * 1000,
+                            stats['mean_interval_s'])
+        
         # Safe shutdown
-        self.psu.safe_shutdown()
+        await self._call(self.psu.safe_shutdown)
         logger.info("PSU safely shut down")
     
-    def _emergency_shutdown(self):
+    async def _emergency_shutdown(self):
         """Emergency shutdown in case of safety violation."""
         logger.error("=== EMERGENCY SHUTDOWN ===")
         
         try:
             # Disable output immediately
-            self.psu.set_output(False)
+            await self._call(self.psu.set_output, False)
             logger.info("Output disabled")
             
             # Set voltage and current to safe levels
-            self.psu.set_voltage(self.battery_specs['nominal_voltage'])
-            self.psu.set_current(0.1)
+            await self._call(self.psu.set_voltage, self.battery_specs['nominal_voltage'])
+            await self._call(self.psu.set_current, 0.1)
             logger.info("PSU set to safe levels")
             
         except Exception as e:
             logger.error(f"Error during emergency shutdown: {e}")
         
-        self.charging_stage = "emergency"
+        self._enter_stage("emergency")
+    
+    def _enter_stage(self, stage: str):
+        """Switch to a new charging stage and notify stage_updates() listeners."""
+        self.charging_stage = stage
+        self._stage_start_ns = time.monotonic_ns()
+        self._prev_sample = None
+        self.stage_changed.set()
+    
+    async def stage_updates(self):
+        """
+        Yield the charging status each time the stage changes.
+        
+        The generator ends after the "complete" or "emergency" stage.
+        """
+        while True:
+            await self.stage_changed.wait()
+            self.stage_changed.clear()
+            status = self.get_charging_status()
+            yield status
+            if status['stage'] in ["complete", "emergency"]:
+                return
     
     def get_charging_status(self) -> dict:
         """Get current charging status."""
-        if not self.start_time:
+        start_ns = self._start_ns
+        if start_ns is None:
             return {"stage": "not_started"}
         
-        elapsed = time.time() - self.start_time
-        stage_elapsed = time.time() - self.stage_start_time if self.stage_start_time else 0
+        now_ns = time.monotonic_ns()
+        stage_start_ns = self._stage_start_ns
+        stage_elapsed_ns = now_ns - stage_start_ns if stage_start_ns is not None else 0
         
         return {
             "stage": self.charging_stage,
-            "total_elapsed_hours": elapsed / 3600,
-            "stage_elapsed_hours": stage_elapsed / 3600,
-            "start_time": datetime.fromtimestamp(self.start_time).isoformat() if self.start_time else None
+            "total_elapsed_hours": (now_ns - start_ns) / NS_PER_HOUR,
+            "stage_elapsed_hours": stage_elapsed_ns / NS_PER_HOUR,
+            "start_time": self.started_at.isoformat()
         }
 
-def main():
+async def status_printer(chargers):
+    """Print a progress line whenever any charger changes stage."""
+    async def follow(number, charger):
+        async for status in charger.stage_updates():
+            print(f"Charger #{number}: {status['stage']} - "
+                  f"Total: {status['total_elapsed_hours']:.1f}h")
+    
+    await asyncio.gather(*(follow(i, c) for i, c in enumerate(chargers, 1)))
+
+async def main():
     """Main function demonstrating gel accumulator charging."""
     
     # Battery specifications (12V 100Ah gel battery example)
@@ -386,34 +659,58 @@ def main():
         'min_temperature': 0.0        # °C
     }
     
-    # Serial connection parameters
-    serial_port = "COM3"  # Change this to your actual serial port
+    # One (serial port, battery specs) pair per PSU; add entries to charge a bank
+    batteries = [
+        ("COM3", battery_specs),  # Change this to your actual serial port
+    ]
     
     try:
-        # Create PSU instance and open serial connection
-        with OwonPSU(serial_port, serial=True) as psu:
+        # Create PSU instances and open serial connections
+        with contextlib.ExitStack() as stack:
             print("=== OWON PSU Gel Accumulator Charging Example ===")
-            print(f"Connected to: {psu.get_identity()}")
             
-            # Get device information
-            device_info = psu.get_device_info()
-            print(f"Device Info: {device_info}")
+            chargers = []
+            for serial_port, specs in batteries:
+                psu = stack.enter_context(OwonPSU(serial_port, serial=True))
+                print(f"Connected to: {psu.get_identity()}")
+                
+                # Get device information
+                device_info = psu.get_device_info()
+                print(f"Device Info: {device_info}")
+                
+                # Create battery charger instance
+                chargers.append(GelAccumulatorCharger(psu, dict(specs)))
+            
+            # Ctrl-C stops every charger and disables its output
+            loop = asyncio.get_running_loop()
             
-            # Create battery charger instance
-            charger = GelAccumulatorCharger(psu, battery_specs)
+            def stop_all():
+                for charger in chargers:
+                    charger.request_stop()
             
-            # Start charging process
-            charger.start_charging()
+            try:
+                loop.add_signal_handler(signal.SIGINT, stop_all)
+            except NotImplementedError:
+                # Windows event loops have no add_signal_handler()
+                signal.signal(signal.SIGINT, lambda signum, frame: loop.call_soon_threadsafe(stop_all))
             
-            # Monitor charging progress
-            while charger.charging_stage not in ["complete", "emergency"]:
-                status = charger.get_charging_status()
-                print(f"\rCharging: {status['stage']} - "
-                      f"Total: {status['total_elapsed_hours']:.1f}h - "
-                      f"Stage: {status['stage_elapsed_hours']:.1f}h", end="")
-                time.sleep(5)
+            # Charge all batteries concurrently on one event loop
+            printer = asyncio.create_task(status_printer(chargers))
+            try:
+                results = await asyncio.gather(*(c.run() for c in chargers),
+                                               return_exceptions=True)
+            finally:
+                printer.cancel()
+                with contextlib.suppress(NotImplementedError):
+                    loop.remove_signal_handler(signal.SIGINT)
             
-            print(f"\nCharging completed. Final stage: {charger.charging_stage}")
+            print()
+            for (serial_port, _), result in zip(batteries, results):
+                if isinstance(result, Exception):
+                    print(f"Charging on {serial_port} failed: {result}")
+                    logger.error(f"Charging on {serial_port} failed: {result}")
+                else:
+                    print(f"Charging on {serial_port} completed. Final stage: {result}")
             
     except OwonPSUError as e:
         print(f"PSU Error: {e}")
@@ -422,23 +719,27 @@ def main():
         print(f"Unexpected error: {e}")
         logger.error(f"Unexpected error: {e}")
 
+async def list_serial_ports_async():
+    """Enumerate serial ports without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, available_serial_ports)
+
 def list_serial_ports():
     """List available serial ports (helper function)."""
     try:
-        import serial.tools.list_ports
-        
-        ports = serial.tools.list_ports.comports()
-        if ports:
-            print("Available serial ports:")
-            for port in ports:
-                print(f"  {port.device}: {port.description}")
-        else:
-            print("No serial ports found")
-    except ImportError:
-        print("pyserial not installed. Install with: pip install pyserial")
+        ports = available_serial_ports()
+    except ImportError as e:
+        print(e)
+        return
+    if ports:
+        print("Available serial ports:")
+        for port in ports:
+            print(f"  {port.device}: {port.description}")
+    else:
+        print("No serial ports found")
 
 if __name__ == "__main__":
     # Uncomment the next line to list available ports
     # list_serial_ports()
     
-    main()
+    asyncio.run(main())
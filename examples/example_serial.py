@@ -3,15 +3,39 @@
 Example: Serial connection to OWON PSU
 Demonstrates how to connect to an OWON PSU via serial port and perform basic operations.
 """
-import os
-import sys
 
-# Add the parent directory to the Python path to access the owon_psu module
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
-
-from owon_psu import OwonPSU, OwonPSUError
 import time
 
+from owon_psu import OwonPSU, OwonPSUError, available_serial_ports
+
+def wait_settled(measure, setpoint, tolerance=0.05, timeout=0.5, poll_interval=0.02):
+    """
+    Poll a measurement until it is within tolerance of its setpoint.
+    
+    Args:
+        measure: Function returning the measured value
+        setpoint: Target value
+        tolerance: Maximum allowed deviation from the setpoint
+        timeout: Maximum settling time in seconds
+        poll_interval: Delay between measurements in seconds
+    
+    Returns:
+        float: Last measured value (out of tolerance if the timeout expired)
+    """
+    deadline = time.monotonic() + timeout
+    measured = measure()
+    while abs(measured - setpoint) > tolerance and time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        measured = measure()
+    return measured
+
+def sweep(setpoints, set_value, measure, unit):
+    """Step through setpoints, printing each settled measurement."""
+    for setpoint in setpoints:
+        set_value(setpoint)
+        measured = wait_settled(measure, setpoint)
+        print(f"Set: {setpoint}{unit}, Measured: {measured:.3f}{unit}")
+
 def main():
     """Main function demonstrating serial PSU control."""
     
@@ -61,19 +85,13 @@ def main():
             # Demonstrate voltage and current changes
             print("--- Demonstrating Voltage Changes ---")
             voltages = [5.0, 10.0, 15.0, 20.0, 12.0]
-            for voltage in voltages:
-                psu.set_voltage(voltage)
-                time.sleep(0.5)  # Allow settling time
-                measured = psu.measure_voltage()
-                print(f"Set: {voltage}V, Measured: {measured:.3f}V")
+            sweep(voltages, psu.set_voltage, psu.measure_voltage, "V")
             
+            # Without a load the current stays below its setpoint, so each
+            # step uses the full settling timeout
             print("\n--- Demonstrating Current Changes ---")
             currents = [0.5, 1.0, 1.5, 2.0, 1.0]
-            for current in currents:
-                psu.set_current(current)
-                time.sleep(0.5)  # Allow settling time
-                measured = psu.measure_current()
-                print(f"Set: {current}A, Measured: {measured:.3f}A")
+            sweep(currents, psu.set_current, psu.measure_current, "A")
             
             # Test remote/local mode
             print("\n--- Testing Remote Mode ---")
@@ -106,9 +124,11 @@ def main():
 
 def list_serial_ports():
     """List available serial ports (helper function)."""
-    import serial.tools.list_ports
-    
-    ports = serial.tools.list_ports.comports()
+    try:
+        ports = available_serial_ports()
+    except ImportError as e:
+        print(e)
+        return
     if ports:
         print("Available serial ports:")
         for port in ports:
@@ -5,17 +5,15 @@ A modern graphical user interface for controlling OWON Power Supply Units.
 Supports both serial and network connections with 3 independent channels.
 """
 
-import os
-import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import threading
+import asyncio
+import contextlib
+import functools
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Add the parent directory to the Python path to access the owon_psu module
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
-
 from owon_psu import OwonPSU, OwonPSUError
 
 # Battery charging profiles
@@ -54,6 +52,19 @@ BATTERY_TYPES = {
     }
 }
 
+# Lines kept in the log panel; older lines are dropped
+MAX_LOG_LINES = 2000
+
+# Delay (ms) for collecting setpoint changes into one write
+SETPOINT_FLUSH_MS = 50
+
+# Consecutive failed reads of a channel before attempting recovery
+MAX_CHANNEL_FAILURES = 3
+
+# Setpoint adjustment buttons per channel: (label, delta)
+VOLTAGE_STEPS = (("-0.1V", -0.1), ("-1V", -1.0), ("+1V", 1.0), ("+0.1V", 0.1))
+CURRENT_STEPS = (("-0.1A", -0.1), ("-0.5A", -0.5), ("+0.5A", 0.5), ("+0.1A", 0.1))
+
 class BatteryCharger:
     """Battery charging control class."""
     
@@ -67,7 +78,7 @@ class BatteryCharger:
         self.cutoff_current = 0.0
         self.charge_channel = 1  # Default to channel 1
         
-    def start_charging(self, battery_type, channel_num=1):
+    async def start_charging(self, battery_type, channel_num=1):
         """Start charging a battery."""
         if not self.gui.connected or not self.gui.psu:
             return False
@@ -84,15 +95,14 @@ class BatteryCharger:
         self.cutoff_current = profile["cutoff_current"]
         
         try:
-            # Select the channel
-            self.gui.psu.write(f"INSTrument:NSELect {channel_num}")
-            
-            # Set voltage and current limits
-            self.gui.psu.write(f"VOLTage {self.target_voltage:.3f}")
-            self.gui.psu.write(f"CURRent {self.target_current:.3f}")
-            
-            # Enable output
-            self.gui.psu.write("OUTPut ON")
+            # Select the channel, set voltage and current limits and
+            # enable output in one write
+            await self.gui._run_io(self.gui.psu.write_many, [
+                f"INSTrument:NSELect {channel_num}",
+                f"VOLTage {self.target_voltage:.3f}",
+                f"CURRent {self.target_current:.3f}",
+                "OUTPut ON"
+            ])
             
             self.charging = True
             self.charge_start_time = time.time()
@@ -112,25 +122,24 @@ class BatteryCharger:
             self.gui.log_message(f"Failed to start charging: {e}")
             return False
     
-    def stop_charging(self):
+    async def stop_charging(self):
         """Stop charging and safely discharge."""
         if not self.charging:
             return
             
         try:
-            # Select the charging channel
-            self.gui.psu.write(f"INSTrument:NSELect {self.charge_channel}")
-            
             # Gradually reduce voltage to safe level
             profile = BATTERY_TYPES[self.battery_type]
             safe_voltage = profile["nominal_voltage"]
             
-            # Set to nominal voltage first
-            self.gui.psu.write(f"VOLTage {safe_voltage:.3f}")
-            time.sleep(1)
+            # Set to nominal voltage first; each write selects the charging
+            # channel again, as monitoring may select others in between
+            select = f"INSTrument:NSELect {self.charge_channel}"
+            await self.gui._run_io(self.gui.psu.write_many, [select, f"VOLTage {safe_voltage:.3f}"])
+            await asyncio.sleep(1)
             
             # Disable output
-            self.gui.psu.write("OUTPut OFF")
+            await self.gui._run_io(self.gui.psu.write_many, [select, "OUTPut OFF"])
             
             # Update channel UI
             channel = self.gui.channels[self.charge_channel - 1]
@@ -144,22 +153,18 @@ class BatteryCharger:
         except Exception as e:
             self.gui.log_message(f"Error stopping charge: {e}")
     
-    def check_charge_complete(self):
+    async def check_charge_complete(self):
         """Check if charging should be completed based on current."""
         if not self.charging or not self.gui.connected:
             return False
             
         try:
-            # Select the charging channel
-            self.gui.psu.write(f"INSTrument:NSELect {self.charge_channel}")
-            
-            # Read current measurement
-            current = float(self.gui.psu.query("MEASure:CURRent?"))
+            current = await self.gui._run_io(self._read_charge_current)
             
             # Check if current has dropped below cutoff
             if current <= self.cutoff_current:
                 self.gui.log_message(f"Charge complete - current dropped to {current:.3f}A")
-                self.stop_charging()
+                await self.stop_charging()
                 return True
                 
             return False
@@ -168,6 +173,11 @@ class BatteryCharger:
             self.gui.log_message(f"Error checking charge status: {e}")
             return False
     
+    def _read_charge_current(self):
+        """Select the charging channel and measure its current (I/O worker)."""
+        self.gui.psu.write(f"INSTrument:NSELect {self.charge_channel}")
+        return float(self.gui.psu.query("MEASure:CURRent?"))
+    
     def get_charge_time(self):
         """Get elapsed charging time in minutes."""
         if not self.charging or not self.charge_start_time:
@@ -184,6 +194,11 @@ class ChannelControl:
         self.gui = gui_instance
         self.frame = None
         
+        # Monitoring commands, built once instead of on every poll
+        self.select_command = f"INSTrument:NSELect {channel_num}"
+        self.measure_commands = (self.select_command, "MEASure:VOLTage?",
+                                 "MEASure:CURRent?", "MEASure:POWer?")
+        
         # Channel variables
         self.voltage_set = tk.DoubleVar(value=12.0)
         self.current_set = tk.DoubleVar(value=1.0)
@@ -194,6 +209,9 @@ class ChannelControl:
         self.current_measured = tk.StringVar(value="0.000")
         self.power_measured = tk.StringVar(value="0.000")
         
+        # Last displayed measurement strings; unchanged values are not re-set
+        self._displayed = {'voltage': "0.000", 'current': "0.000", 'power': "0.000"}
+    
     def create_channel_frame(self, parent):
         """Create the channel control frame."""
         self.frame = ttk.LabelFrame(parent, text=f"Channel {self.channel_num}", padding="10")
@@ -216,10 +234,7 @@ class ChannelControl:
         adj_frame = ttk.Frame(voltage_frame)
         adj_frame.grid(row=3, column=0)
         
-        ttk.Button(adj_frame, text="-0.1V", command=lambda: self.adjust_voltage(-0.1)).grid(row=0, column=0, padx=(0, 5))
-        ttk.Button(adj_frame, text="-1V", command=lambda: self.adjust_voltage(-1.0)).grid(row=0, column=1, padx=(0, 5))
-        ttk.Button(adj_frame, text="+1V", command=lambda: self.adjust_voltage(1.0)).grid(row=0, column=2, padx=(0, 5))
-        ttk.Button(adj_frame, text="+0.1V", command=lambda: self.adjust_voltage(0.1)).grid(row=0, column=3)
+        self._create_step_buttons(adj_frame, VOLTAGE_STEPS, self.adjust_voltage)
         
         # Right column - Current control
         current_frame = ttk.LabelFrame(self.frame, text="Current Control", padding="10")
@@ -235,10 +250,7 @@ class ChannelControl:
         adj_frame2 = ttk.Frame(current_frame)
         adj_frame2.grid(row=3, column=0)
         
-        ttk.Button(adj_frame2, text="-0.1A", command=lambda: self.adjust_current(-0.1)).grid(row=0, column=0, padx=(0, 5))
-        ttk.Button(adj_frame2, text="-0.5A", command=lambda: self.adjust_current(-0.5)).grid(row=0, column=1, padx=(0, 5))
-        ttk.Button(adj_frame2, text="+0.5A", command=lambda: self.adjust_current(0.5)).grid(row=0, column=2, padx=(0, 5))
-        ttk.Button(adj_frame2, text="+0.1A", command=lambda: self.adjust_current(0.1)).grid(row=0, column=3)
+        self._create_step_buttons(adj_frame2, CURRENT_STEPS, self.adjust_current)
         
         # Output control and measurements
         control_frame = ttk.LabelFrame(self.frame, text="Output Control & Measurements", padding="10")
@@ -265,6 +277,13 @@ class ChannelControl:
         
         ttk.Label(measurements_frame, text="Measured Power:").grid(row=1, column=0, sticky=tk.W, padx=(0, 10), pady=(5, 0))
         ttk.Label(measurements_frame, textvariable=self.power_measured, font=("Arial", 10, "bold")).grid(row=1, column=1, sticky=tk.W, padx=(0, 20), pady=(5, 0))
+    
+    def _create_step_buttons(self, parent, steps, adjust):
+        """Create a row of adjustment buttons calling adjust(delta)."""
+        last = len(steps) - 1
+        for column, (label, delta) in enumerate(steps):
+            ttk.Button(parent, text=label, command=functools.partial(adjust, delta)).grid(
+                row=0, column=column, padx=(0, 5) if column < last else 0)
         
     def set_psu(self, psu_instance, gui_instance=None):
         """Set the PSU instance for this channel."""
@@ -277,11 +296,7 @@ class ChannelControl:
         if not self.psu:
             return
         try:
-            # Select the channel first
-            self.psu.write(f"INSTrument:NSELect {self.channel_num}")
-            # Then set the voltage for the selected channel
-            voltage = self.voltage_set.get()
-            self.psu.write(f"VOLTage {voltage:.3f}")
+            self.gui.queue_setpoint(self.channel_num, "VOLTage", self.voltage_set.get())
         except Exception as e:
             print(f"Channel {self.channel_num} voltage error: {e}")
             
@@ -290,11 +305,7 @@ class ChannelControl:
         if not self.psu:
             return
         try:
-            # Select the channel first
-            self.psu.write(f"INSTrument:NSELect {self.channel_num}")
-            # Then set the current for the selected channel
-            current = self.current_set.get()
-            self.psu.write(f"CURRent {current:.3f}")
+            self.gui.queue_setpoint(self.channel_num, "CURRent", self.current_set.get())
         except Exception as e:
             print(f"Channel {self.channel_num} current error: {e}")
             
@@ -315,18 +326,9 @@ class ChannelControl:
         if not self.psu or not self.gui:
             return
         try:
-            # Get current output states for all channels
-            output_states = []
-            for i, channel in enumerate(self.gui.channels):
-                if i == self.channel_num - 1:  # This channel
-                    output_states.append(1 if self.output_enabled.get() else 0)
-                else:  # Other channels - keep their current state
-                    output_states.append(1 if channel.output_enabled.get() else 0)
-            
-            # Send command to set all channel outputs at once
-            # Format: CHAN:OUTP:ALL <ch1>,<ch2>,<ch3>
-            command = f"CHAN:OUTP:ALL {output_states[0]},{output_states[1]},{output_states[2]}"
-            self.psu.write(command)
+            # This channel's variable already holds the new state; other
+            # channels keep their current state
+            self.gui._write_all_outputs([channel.output_enabled.get() for channel in self.gui.channels])
             
         except Exception as e:
             print(f"Channel {self.channel_num} output error: {e}")
@@ -337,21 +339,37 @@ class ChannelControl:
             return
         try:
             # Set voltage to 0 and disable output for this channel
-            self.psu.write(f"APP:VOLT 0.0,0.0,0.0")
-            self.psu.write(f"APP:OUTP 0,0,0")
+            self.gui.drop_setpoints()
             self.output_enabled.set(False)
             self.voltage_set.set(0.0)
+            description = f"Channel {self.channel_num} shutdown"
+            self.gui._submit_io(description, self.psu.write_many,
+                                [self.select_command, "VOLTage 0.0"])
+            self.gui._write_all_outputs([c.output_enabled.get() for c in self.gui.channels],
+                                        description)
         except Exception as e:
             print(f"Channel {self.channel_num} shutdown error: {e}")
             
     def update_measurements(self, status):
+        """Queue measurements for the next display refresh."""
+        self.gui._pending_status[self.channel_num] = status
+    
+    def show_measurements(self, status):
         """Update measurement displays."""
         try:
-            self.voltage_measured.set(f"{status['voltage']:.3f}")
-            self.current_measured.set(f"{status['current']:.3f}")
-            self.power_measured.set(f"{status['power']:.3f}")
+            for key, var in (('voltage', self.voltage_measured),
+                             ('current', self.current_measured),
+                             ('power', self.power_measured)):
+                text = f"{status[key]:.3f}"
+                if text != self._displayed[key]:
+                    var.set(text)
+                    self._displayed[key] = text
         except Exception as e:
             print(f"Channel {self.channel_num} measurement error: {e}")
+    
+    def clear_measurements(self):
+        """Reset measurement displays to zero."""
+        self.show_measurements({'voltage': 0.0, 'current': 0.0, 'power': 0.0})
 
 class OwonPSUGUI:
     """Main GUI application for OWON PSU control with 3 channels."""
@@ -367,13 +385,53 @@ class OwonPSUGUI:
         self.psu = None
         self.connected = False
         self.monitoring = False
-        self.monitor_thread = None
+        self.monitor_task = None
+        
+        # Latest status per channel, shown by one idle-time refresh
+        self._pending_status = {}
+        self._flush_id = None
+        self._last_draw_ts = 0.0
+        
+        # Cleared after MAX_CHANNEL_FAILURES failed compound monitoring
+        # queries in a row; a single timeout or short reply is transient
+        self._batch_monitor = True
+        self._batch_failures = 0
+        
+        # Consecutive failed reads per channel number
+        self._channel_failures = {}
+        
+        # Log lines waiting to be appended by one idle-time insert
+        self._log_pending = []
+        self._log_flush_id = None
+        
+        # Log timestamp, formatted again only when the second changes
+        self._log_sec = None
+        self._log_ts = ""
+        
+        # Setpoints waiting to be written, latest value per (channel, header)
+        self._pending_set = {}
+        self._set_flush_id = None
+        
+        # asyncio loop pumped from the Tk event loop, so coroutines run on the
+        # Tk thread; blocking PSU I/O goes to a single worker thread, which
+        # keeps channel selection and its queries from interleaving
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.io_executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Set to wake the monitor loop for an immediate poll
+        self._refresh_event = asyncio.Event()
         
         # Channel controls
         self.channels = []
         for i in range(1, 4):  # Channels 1, 2, 3
             self.channels.append(ChannelControl(i, None, self))
         
+        # Compound query reading every channel and the output states
+        self._monitor_commands = [command for channel in self.channels
+                                  for command in channel.measure_commands]
+        self._monitor_commands.append("CHAN:OUTP:ALL?")
+        
         # Battery charger
         self.battery_charger = BatteryCharger(self)
         
@@ -387,7 +445,7 @@ class OwonPSUGUI:
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
         
-        # Start monitoring thread
+        # Start monitoring task
         self.start_monitoring()
         
     def setup_variables(self):
@@ -402,6 +460,9 @@ class OwonPSUGUI:
         self.device_status = tk.StringVar(value="Disconnected")
         self.current_channel = tk.IntVar(value=1)  # Currently selected channel
         
+        # Display variables
+        self.max_redraw_hz = tk.IntVar(value=10)  # Upper bound on measurement redraws per second
+        
         # Battery charging variables
         self.battery_type = tk.StringVar(value="18650 Li-ion")
         self.charge_channel = tk.IntVar(value=1)
@@ -504,6 +565,9 @@ class OwonPSUGUI:
         self.status_label = ttk.Label(status_frame, textvariable=self.device_status, foreground="red")
         self.status_label.grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
         
+        ttk.Label(status_frame, text="Max Redraw Rate (Hz):").grid(row=1, column=0, sticky=tk.W)
+        ttk.Spinbox(status_frame, from_=1, to=60, textvariable=self.max_redraw_hz, width=5).grid(row=1, column=1, sticky=tk.W, padx=(10, 0))
+        
         # Global actions
         actions_frame = ttk.LabelFrame(global_frame, text="Global Actions", padding="10")
         actions_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
@@ -541,6 +605,14 @@ class OwonPSUGUI:
             
         self.overview_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        # One row per channel, updated in place by update_overview()
+        self._overview_values = {}
+        for channel in self.channels:
+            values = (channel.channel_num, "0.000", "0.000", "0.000", "OFF")
+            iid = self.overview_tree.insert("", "end", values=values)
+            self._overview_values[iid] = values
+        self._overview_iids = list(self._overview_values)
+        
         # Scrollbar for overview
         scrollbar = ttk.Scrollbar(overview_frame, orient="vertical", command=self.overview_tree.yview)
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
@@ -640,23 +712,57 @@ class OwonPSUGUI:
             
     def log_message(self, message):
         """Add message to log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
+        sec = int(time.time())
+        if sec != self._log_sec:
+            self._log_ts = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._log_sec = sec
+        self._log_pending.append(f"[{self._log_ts}] {message}\n")
+        if self._log_flush_id is None:
+            self._log_flush_id = self.root.after_idle(self._flush_log)
+    
+    def _flush_log(self):
+        """Append pending log lines and drop the oldest beyond MAX_LOG_LINES."""
+        self._log_flush_id = None
+        if not self._log_pending:
+            return
+        self.log_text.insert(tk.END, "".join(self._log_pending))
+        self._log_pending.clear()
+        
+        # The Text widget always ends with an empty line after the last newline
+        excess = int(self.log_text.index("end-1c").split(".")[0]) - 1 - MAX_LOG_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
         self.log_text.see(tk.END)
         
     def clear_log(self):
         """Clear the log."""
+        self._log_pending.clear()
         self.log_text.delete(1.0, tk.END)
         
     def save_log(self):
         """Save log to file."""
+        self._flush_log()
+        filename = f"owon_psu_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        # Snapshot the text on the Tk thread; the file is written in the background
+        text = self.log_text.get(1.0, tk.END)
+        self.loop.create_task(self._save_log(filename, text))
+    
+    async def _save_log(self, filename, text):
+        """Write the log file on a worker thread and report the result."""
+        def write():
+            # Binary mode: the encoded log goes out in one large write
+            with open(filename, 'wb') as f:
+                f.write(text.encode('utf-8'))
+        
+        # Dialogs are shown from a Tk callback: a modal dialog inside the
+        # coroutine would hold up the asyncio pump, and with it monitoring
         try:
-            filename = f"owon_psu_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-            with open(filename, 'w') as f:
-                f.write(self.log_text.get(1.0, tk.END))
-            messagebox.showinfo("Success", f"Log saved to {filename}")
+            # Default executor, so saving never waits behind PSU I/O
+            await self.loop.run_in_executor(None, write)
+            self.root.after(0, lambda: messagebox.showinfo("Success", f"Log saved to {filename}"))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save log: {e}")
+            message = f"Failed to save log: {e}"
+            self.root.after(0, lambda: messagebox.showerror("Error", message))
             
     def connect_psu(self):
         """Connect to PSU."""
@@ -675,7 +781,14 @@ class OwonPSUGUI:
                 self.psu = OwonPSU(port, serial=True)
                 self.psu.open_serial()
                 
+                # Avoid the USB-serial latency timer delaying every reply
+                if self.psu.set_low_latency():
+                    self.log_message("Low-latency serial mode enabled")
+            
             self.connected = True
+            self._batch_monitor = True
+            self._batch_failures = 0
+            self._channel_failures.clear()
             self.device_status.set("Connected")
             self.status_label.config(foreground="green")
             
@@ -691,24 +804,48 @@ class OwonPSUGUI:
             # Update all channel controls with PSU instance
             for channel in self.channels:
                 channel.set_psu(self.psu, self)
-                # Update channel values with channel selection
-                try:
-                    # Select the channel first
-                    self.psu.write(f"INSTrument:NSELect {channel.channel_num}")
-                    # Then read values for the selected channel
-                    voltage = float(self.psu.query("VOLTage?"))
-                    current = float(self.psu.query("CURRent?"))
-                    output = self.psu.query("OUTPut?") in ["1", "ON"]
-                    
-                    channel.voltage_set.set(voltage)
-                    channel.current_set.set(current)
-                    channel.output_enabled.set(output)
-                except:
-                    pass  # Handle case where channel-specific commands aren't available
+            
+            # Update channel values with channel selection
+            self.read_channel_settings()
             
         except Exception as e:
             self.log_message(f"Connection failed: {e}")
             messagebox.showerror("Connection Error", str(e))
+    
+    def read_channel_settings(self):
+        """Read set voltage, set current and output state of all channels in one query."""
+        self._apply_channel_settings(self._read_channel_settings())
+    
+    def _read_channel_settings(self):
+        """
+        Query the settings of all channels (I/O worker).
+        
+        Returns:
+            list: Set voltage, set current and output state per channel, or
+            None if channel-specific commands aren't available
+        """
+        commands = []
+        for channel in self.channels:
+            # Select the channel first, then read values for the selected channel
+            commands += [f"INSTrument:NSELect {channel.channel_num}", "VOLTage?", "CURRent?", "OUTPut?"]
+        
+        try:
+            return self.psu.query_multi(commands)
+        except OwonPSUError:
+            return None
+    
+    def _apply_channel_settings(self, values):
+        """Show settings read by _read_channel_settings() in the channel controls."""
+        if values is None:
+            return
+        try:
+            for i, channel in enumerate(self.channels):
+                voltage, current, output = values[3 * i:3 * i + 3]
+                channel.voltage_set.set(float(voltage))
+                channel.current_set.set(float(current))
+                channel.output_enabled.set(output in ["1", "ON"])
+        except ValueError:
+            pass  # Unexpected reply; keep the current values
             
     def disconnect_psu(self):
         """Disconnect from PSU."""
@@ -728,10 +865,9 @@ class OwonPSUGUI:
             self.stop_charge_btn.config(state="disabled")
             
             # Clear all channel measurements
+            self._pending_status.clear()
             for channel in self.channels:
-                channel.voltage_measured.set("0.000")
-                channel.current_measured.set("0.000")
-                channel.power_measured.set("0.000")
+                channel.clear_measurements()
                 channel.set_psu(None)
             
             self.log_message("Disconnected from PSU")
@@ -746,28 +882,26 @@ class OwonPSUGUI:
             return
             
         if messagebox.askyesno("Confirm Reset", "Are you sure you want to reset all channels to defaults?"):
-            try:
-                self.psu.reset()
-                self.log_message("All channels reset to defaults")
-                # Update UI after reset
-                time.sleep(0.5)
-                for channel in self.channels:
-                    try:
-                        # Select the channel first
-                        self.psu.write(f"INSTrument:NSELect {channel.channel_num}")
-                        # Then read values for the selected channel
-                        voltage = float(self.psu.query("VOLTage?"))
-                        current = float(self.psu.query("CURRent?"))
-                        output = self.psu.query("OUTPut?") in ["1", "ON"]
-                        
-                        channel.voltage_set.set(voltage)
-                        channel.current_set.set(current)
-                        channel.output_enabled.set(output)
-                    except:
-                        pass
-            except Exception as e:
-                self.log_message(f"Reset failed: {e}")
-                messagebox.showerror("Error", f"Reset failed: {e}")
+            self.drop_setpoints()
+            self.loop.create_task(self._reset_all_channels())
+    
+    async def _reset_all_channels(self):
+        """Reset the PSU and re-read channel settings once it reports completion."""
+        try:
+            await self._run_io(self.psu.reset)
+        except Exception as e:
+            self._report_error(f"Reset failed: {e}")
+            return
+        self.log_message("All channels reset to defaults")
+        
+        try:
+            await self._run_io(self.psu.wait_for_opc, 5.0)
+            # Query on the I/O worker so it cannot interleave with a monitor
+            # poll; the Tk variables are set back on the loop thread
+            values = await self._run_io(self._read_channel_settings)
+            self._apply_channel_settings(values)
+        except Exception as e:
+            self.log_message(f"Failed to refresh channels after reset: {e}")
                 
     def safe_shutdown_all(self):
         """Perform safe shutdown for all channels."""
@@ -775,20 +909,16 @@ class OwonPSUGUI:
             messagebox.showwarning("Not Connected", "Please connect to PSU first")
             return
             
-        try:
-            # Set all voltages to 0 and disable all outputs
-            self.psu.write("APP:VOLT 0.0,0.0,0.0")
-            self.psu.write("CHAN:OUTP:ALL 0,0,0")
-            
-            # Update UI
+        def done(_):
             for channel in self.channels:
                 channel.output_enabled.set(False)
                 channel.voltage_set.set(0.0)
-            
             self.log_message("Safe shutdown completed for all channels")
-        except Exception as e:
-            self.log_message(f"Safe shutdown failed: {e}")
-            messagebox.showerror("Error", f"Safe shutdown failed: {e}")
+        
+        # Set all voltages to 0 and disable all outputs
+        self.drop_setpoints()
+        self._submit_io("Safe shutdown", self.psu.write_many,
+                        ["APP:VOLT 0.0,0.0,0.0", "CHAN:OUTP:ALL 0,0,0"], on_done=done)
             
     def enable_all_outputs(self):
         """Enable output for all channels."""
@@ -796,17 +926,13 @@ class OwonPSUGUI:
             messagebox.showwarning("Not Connected", "Please connect to PSU first")
             return
             
-        try:
-            # Set all channels to enabled
-            for channel in self.channels:
-                channel.output_enabled.set(True)
-            
-            # Send single command to enable all outputs
-            self.psu.write("CHAN:OUTP:ALL 1,1,1")
-            self.log_message("All outputs enabled")
-        except Exception as e:
-            self.log_message(f"Failed to enable all outputs: {e}")
-            messagebox.showerror("Error", f"Failed to enable all outputs: {e}")
+        # Set all channels to enabled
+        for channel in self.channels:
+            channel.output_enabled.set(True)
+        
+        # Send single command to enable all outputs
+        self._write_all_outputs((True, True, True), "Enabling all outputs",
+                                lambda _: self.log_message("All outputs enabled"))
             
     def disable_all_outputs(self):
         """Disable output for all channels."""
@@ -814,18 +940,58 @@ class OwonPSUGUI:
             messagebox.showwarning("Not Connected", "Please connect to PSU first")
             return
             
-        try:
-            # Set all channels to disabled
-            for channel in self.channels:
-                channel.output_enabled.set(False)
-            
-            # Send single command to disable all outputs
-            self.psu.write("CHAN:OUTP:ALL 0,0,0")
-            self.log_message("All outputs disabled")
-        except Exception as e:
-            self.log_message(f"Failed to disable all outputs: {e}")
-            messagebox.showerror("Error", f"Failed to disable all outputs: {e}")
-            
+        # Set all channels to disabled
+        for channel in self.channels:
+            channel.output_enabled.set(False)
+        
+        # Send single command to disable all outputs
+        self._write_all_outputs((False, False, False), "Disabling all outputs",
+                                lambda _: self.log_message("All outputs disabled"))
+            
+    def queue_setpoint(self, channel_num, header, value):
+        """
+        Queue a VOLTage or CURRent setpoint for a channel.
+        
+        Changes arriving within SETPOINT_FLUSH_MS (e.g. repeated step button
+        clicks) are written together, and only the latest value per channel
+        and setting is sent.
+        """
+        self._pending_set[(channel_num, header)] = value
+        if self._set_flush_id is None:
+            self._set_flush_id = self.root.after(SETPOINT_FLUSH_MS, self._flush_setpoints)
+    
+    def drop_setpoints(self, header=None):
+        """Discard queued setpoints (only those for header, if given)."""
+        if header is None:
+            self._pending_set.clear()
+        else:
+            for key in [key for key in self._pending_set if key[1] == header]:
+                del self._pending_set[key]
+    
+    def _flush_setpoints(self):
+        """Write the queued setpoints in one compound command."""
+        self._set_flush_id = None
+        if not self._pending_set or not self.psu:
+            self._pending_set.clear()
+            return
+        
+        # Select each channel once, then set its values
+        commands = []
+        selected = None
+        for (channel_num, header), value in sorted(self._pending_set.items()):
+            if channel_num != selected:
+                commands.append(f"INSTrument:NSELect {channel_num}")
+                selected = channel_num
+            commands.append(f"{header} {value:.3f}")
+        self._pending_set.clear()
+        
+        self._submit_io("Applying settings", self.psu.write_many, commands, show_dialog=False)
+    
+    def _write_all_outputs(self, states, description="Setting outputs", on_done=None):
+        """Set the outputs of all channels with one CHAN:OUTP:ALL <ch1>,<ch2>,<ch3> command."""
+        self._submit_io(description, self.psu.write,
+                        "CHAN:OUTP:ALL {:d},{:d},{:d}".format(*states), on_done=on_done)
+    
     def set_all_voltages(self):
         """Set voltage for all channels using bulk command."""
         if not self.connected:
@@ -849,19 +1015,22 @@ class OwonPSUGUI:
                 voltage = float(voltage_text)
                 voltages = [voltage, voltage, voltage]
             
-            # Set voltage for each channel individually using channel selection
+            # Set voltage for each channel individually using channel selection,
+            # all in one write
+            commands = []
             for i, channel in enumerate(self.channels):
-                self.psu.write(f"INSTrument:NSELect {channel.channel_num}")
-                self.psu.write(f"VOLTage {voltages[i]:.3f}")
-                channel.voltage_set.set(voltages[i])
-            
-            self.log_message(f"Set all voltages: CH1={voltages[0]}V, CH2={voltages[1]}V, CH3={voltages[2]}V")
-            
+                commands += [f"INSTrument:NSELect {channel.channel_num}", f"VOLTage {voltages[i]:.3f}"]
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid numbers")
-        except Exception as e:
-            self.log_message(f"Failed to set all voltages: {e}")
-            messagebox.showerror("Error", f"Failed to set all voltages: {e}")
+            return
+        
+        def done(_):
+            for i, channel in enumerate(self.channels):
+                channel.voltage_set.set(voltages[i])
+            self.log_message(f"Set all voltages: CH1={voltages[0]}V, CH2={voltages[1]}V, CH3={voltages[2]}V")
+        
+        self.drop_setpoints("VOLTage")
+        self._submit_io("Setting all voltages", self.psu.write_many, commands, on_done=done)
             
     def set_all_currents(self):
         """Set current for all channels using bulk command."""
@@ -886,77 +1055,200 @@ class OwonPSUGUI:
                 current = float(current_text)
                 currents = [current, current, current]
             
-            # Set current for each channel individually using channel selection
+            # Set current for each channel individually using channel selection,
+            # all in one write
+            commands = []
             for i, channel in enumerate(self.channels):
-                self.psu.write(f"INSTrument:NSELect {channel.channel_num}")
-                self.psu.write(f"CURRent {currents[i]:.3f}")
-                channel.current_set.set(currents[i])
-            
-            self.log_message(f"Set all currents: CH1={currents[0]}A, CH2={currents[1]}A, CH3={currents[2]}A")
-            
+                commands += [f"INSTrument:NSELect {channel.channel_num}", f"CURRent {currents[i]:.3f}"]
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid numbers")
-        except Exception as e:
-            self.log_message(f"Failed to set all currents: {e}")
-            messagebox.showerror("Error", f"Failed to set all currents: {e}")
+            return
+        
+        def done(_):
+            for i, channel in enumerate(self.channels):
+                channel.current_set.set(currents[i])
+            self.log_message(f"Set all currents: CH1={currents[0]}A, CH2={currents[1]}A, CH3={currents[2]}A")
+        
+        self.drop_setpoints("CURRent")
+        self._submit_io("Setting all currents", self.psu.write_many, commands, on_done=done)
                 
     def start_monitoring(self):
-        """Start monitoring thread."""
+        """Start monitoring task."""
         if not self.monitoring:
             self.monitoring = True
-            self.monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
-            self.monitor_thread.start()
+            self.monitor_task = self.loop.create_task(self.monitor_loop())
+            self.root.after(50, self._pump_asyncio)
             
-    def monitor_loop(self):
+    def stop_monitoring(self):
+        """Stop monitoring task and release the I/O worker."""
+        self.monitoring = False
+        if self.monitor_task is not None:
+            self.monitor_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                self.loop.run_until_complete(self.monitor_task)
+            self.monitor_task = None
+        self.io_executor.shutdown(wait=False)
+        self.loop.close()
+    
+    def request_refresh(self):
+        """Poll the PSU now instead of at the next monitoring interval."""
+        self._refresh_event.set()
+    
+    def _pump_asyncio(self):
+        """Run one pass of ready asyncio callbacks from the Tk event loop."""
+        if not self.monitoring:
+            return
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.root.after(50, self._pump_asyncio)
+    
+    def _run_io(self, func, *args):
+        """Run a blocking PSU call on the I/O worker and return an awaitable."""
+        return self.loop.run_in_executor(self.io_executor, func, *args)
+    
+    def _submit_io(self, description, func, *args, on_done=None, show_dialog=True):
+        """
+        Run a PSU command on the I/O worker from a Tk callback.
+        
+        On success the monitor is asked for a fresh poll and on_done, if
+        given, is called with the result on the loop thread; a failure is
+        logged as "<description> failed: <error>" and, with show_dialog,
+        shown in an error dialog.
+        """
+        async def run():
+            try:
+                result = await self._run_io(func, *args)
+            except Exception as e:
+                self._report_error(f"{description} failed: {e}", show_dialog)
+                return
+            self.request_refresh()
+            if on_done is not None:
+                on_done(result)
+        
+        self.loop.create_task(run())
+    
+    def _report_error(self, message, show_dialog=True):
+        """Log an error and show it from a Tk callback, outside the asyncio pump."""
+        self.log_message(message)
+        if show_dialog:
+            self.root.after(0, lambda: messagebox.showerror("Error", message))
+    
+    def _read_output_states(self):
+        """Read output states of all channels at once (I/O worker)."""
+        try:
+            output_states = self.psu.query("CHAN:OUTP:ALL?").strip().split(',')
+            return [state.strip() in ["1", "ON"] for state in output_states]
+        except (OwonPSUError, ValueError):
+            return [False, False, False]
+    
+    def _read_channel(self, channel):
+        """Select a channel and read its measurements (I/O worker)."""
+        # Select the channel first
+        select, voltage, current, power = channel.measure_commands
+        self.psu.write(select)
+        # Then read measurements for the selected channel
+        return {
+            'voltage': float(self.psu.query(voltage)),
+            'current': float(self.psu.query(current)),
+            'power': float(self.psu.query(power))
+        }
+    
+    def _read_all_channels(self):
+        """
+        Read measurements of all channels and their output states in one
+        compound query (I/O worker).
+        
+        Returns:
+            tuple: (list of measurement dicts in channel order, output states)
+        """
+        values = self.psu.query_multi(self._monitor_commands)
+        output_states = [state.strip() in ["1", "ON"] for state in values.pop().split(',')]
+        # Convert all readings in one pass, then take them three per channel
+        readings = iter(list(map(float, values)))
+        measurements = [
+            {'voltage': voltage, 'current': current, 'power': power}
+            for voltage, current, power in zip(readings, readings, readings)
+        ]
+        return measurements, output_states
+    
+    def _channel_status(self, channel, status, output_states):
+        """Complete a channel's measurements into a (channel number, status) pair."""
+        if 'output_enabled' not in status:
+            # Use the output state from the bulk query
+            channel_num = channel.channel_num
+            status['output_enabled'] = output_states[channel_num - 1] if channel_num <= len(output_states) else False
+            status['set_voltage'] = channel.voltage_set.get()
+            status['set_current'] = channel.current_set.get()
+        return channel.channel_num, status
+    
+    async def _poll_channel(self, channel, output_states):
+        """
+        Poll one channel and return its (channel number, status) pair.
+        
+        A failed read returns None so the channel keeps its last values;
+        after MAX_CHANNEL_FAILURES failures in a row the connection is
+        resynchronised once, clearing status and any late replies.
+        """
+        channel_num = channel.channel_num
+        try:
+            status = await self._run_io(self._read_channel, channel)
+        except (OwonPSUError, ValueError) as e:
+            failures = self._channel_failures.get(channel_num, 0) + 1
+            self._channel_failures[channel_num] = failures
+            if failures == MAX_CHANNEL_FAILURES:
+                self.log_message(f"Channel {channel_num} read failed {failures} times: {e}")
+                try:
+                    await self._run_io(self.psu.resync)
+                except OwonPSUError:
+                    pass
+            return None
+        
+        self._channel_failures[channel_num] = 0
+        return self._channel_status(channel, status, output_states)
+    
+    async def _poll_all_channels(self):
+        """Poll every channel, in one round-trip when the device allows it."""
+        if self._batch_monitor:
+            try:
+                measurements, output_states = await self._run_io(self._read_all_channels)
+                self._batch_failures = 0
+                return [self._channel_status(channel, status, output_states)
+                        for channel, status in zip(self.channels, measurements)]
+            except (OwonPSUError, ValueError) as e:
+                self._batch_failures += 1
+                if self._batch_failures < MAX_CHANNEL_FAILURES:
+                    raise  # Possibly transient; skip this poll but keep batching
+                self._batch_monitor = False
+                self.log_message(f"Compound queries not supported, polling channels separately: {e}")
+        
+        # Get output states for all channels at once
+        output_states = await self._run_io(self._read_output_states)
+        
+        # Get status for each channel separately, leaving out failed reads
+        statuses = await asyncio.gather(
+            *(self._poll_channel(channel, output_states) for channel in self.channels))
+        return [status for status in statuses if status is not None]
+    
+    async def monitor_loop(self):
         """Background monitoring loop."""
         while self.monitoring:
             if self.connected and self.psu:
                 try:
-                    # Get status for each channel separately
-                    channel_statuses = []
-                    
-                    # Get output states for all channels at once
-                    try:
-                        output_states = self.psu.query("CHAN:OUTP:ALL?").strip().split(',')
-                        output_states = [state.strip() in ["1", "ON"] for state in output_states]
-                    except:
-                        output_states = [False, False, False]
+                    channel_statuses = await self._poll_all_channels()
                     
-                    for channel in self.channels:
-                        try:
-                            # Select the channel first
-                            self.psu.write(f"INSTrument:NSELect {channel.channel_num}")
-                            # Then read measurements for the selected channel
-                            voltage = float(self.psu.query("MEASure:VOLTage?"))
-                            current = float(self.psu.query("MEASure:CURRent?"))
-                            power = float(self.psu.query("MEASure:POWer?"))
-                            
-                            # Use the output state from the bulk query
-                            output = output_states[channel.channel_num - 1] if channel.channel_num <= len(output_states) else False
-                            
-                            status = {
-                                'voltage': voltage,
-                                'current': current,
-                                'power': power,
-                                'output_enabled': output,
-                                'set_voltage': channel.voltage_set.get(),
-                                'set_current': channel.current_set.get()
-                            }
-                            channel_statuses.append((channel.channel_num, status))
-                        except:
-                            # If channel-specific command fails, use default
-                            status = self.psu.get_measurement_status()
-                            channel_statuses.append((channel.channel_num, status))
-                    
-                    # Update GUI in main thread
-                    self.root.after(0, self.update_all_measurements, channel_statuses)
-                    self.root.after(0, self.update_overview)
-                    self.root.after(0, self.update_charge_status)
+                    # Coroutines run on the Tk thread, so update the GUI directly
+                    self.update_all_measurements(channel_statuses)
+                    await self.update_charge_status()
                     
                 except Exception as e:
-                    self.root.after(0, self.log_message, f"Monitoring error: {e}")
+                    self.log_message(f"Monitoring error: {e}")
                     
-            time.sleep(1)  # Update every second
+            # Update every second, or sooner when a setting was changed
+            try:
+                await asyncio.wait_for(self._refresh_event.wait(), 1.0)
+            except asyncio.TimeoutError:
+                pass
+            self._refresh_event.clear()
             
     def update_all_measurements(self, channel_statuses):
         """Update measurement displays for all channels."""
@@ -967,23 +1259,48 @@ class OwonPSUGUI:
                 channel.update_measurements(status)
         except Exception as e:
             self.log_message(f"Failed to update measurements: {e}")
+        
+        # Refresh all displays together once Tk is idle
+        if self._flush_id is None:
+            self._flush_id = self.root.after_idle(self._flush_measurements)
+    
+    def _flush_measurements(self):
+        """Show queued measurements and the overview in a single redraw."""
+        self._flush_id = None
+        
+        # Hold back redraws beyond the configured rate; the newest
+        # measurements stay queued and are shown when the interval expires
+        try:
+            min_interval = 1.0 / max(1, self.max_redraw_hz.get())
+        except (tk.TclError, ValueError):
+            min_interval = 0.1  # Spinbox is being edited
+        wait = self._last_draw_ts + min_interval - time.monotonic()
+        if wait > 0:
+            self._flush_id = self.root.after(int(wait * 1000) + 1, self._flush_measurements)
+            return
+        self._last_draw_ts = time.monotonic()
+        
+        pending, self._pending_status = self._pending_status, {}
+        for channel_num, status in pending.items():
+            self.channels[channel_num - 1].show_measurements(status)
+        self.update_overview()
+        self.root.update_idletasks()
             
     def update_overview(self):
         """Update the channel overview table."""
         try:
-            # Clear existing items
-            for item in self.overview_tree.get_children():
-                self.overview_tree.delete(item)
-                
-            # Add current channel status
-            for i, channel in enumerate(self.channels):
-                channel_num = i + 1
+            # Update each channel's row in place
+            for iid, channel in zip(self._overview_iids, self.channels):
                 voltage = channel.voltage_measured.get()
                 current = channel.current_measured.get()
                 power = channel.power_measured.get()
                 output = "ON" if channel.output_enabled.get() else "OFF"
                 
-                self.overview_tree.insert("", "end", values=(channel_num, voltage, current, power, output))
+                # Only touch rows whose values changed
+                values = (channel.channel_num, voltage, current, power, output)
+                if values != self._overview_values[iid]:
+                    self.overview_tree.item(iid, values=values)
+                    self._overview_values[iid] = values
         except Exception as e:
             self.log_message(f"Failed to update overview: {e}")
     
@@ -1027,15 +1344,19 @@ class OwonPSUGUI:
         msg += f"Cutoff Current: {profile['cutoff_current']}A"
         
         if messagebox.askyesno("Confirm Charging", msg):
-            if self.battery_charger.start_charging(battery_type, channel_num):
-                self.charge_status.set("Charging")
-                self.charge_status_label.config(foreground="green")
-                self.start_charge_btn.config(state="disabled")
-                self.stop_charge_btn.config(state="normal")
-                self.battery_type_combo.config(state="disabled")
-                self.charge_channel_combo.config(state="disabled")
-            else:
-                messagebox.showerror("Error", "Failed to start charging")
+            self.loop.create_task(self._start_battery_charging(battery_type, channel_num))
+    
+    async def _start_battery_charging(self, battery_type, channel_num):
+        """Start charging and update the charging controls."""
+        if await self.battery_charger.start_charging(battery_type, channel_num):
+            self.charge_status.set("Charging")
+            self.charge_status_label.config(foreground="green")
+            self.start_charge_btn.config(state="disabled")
+            self.stop_charge_btn.config(state="normal")
+            self.battery_type_combo.config(state="disabled")
+            self.charge_channel_combo.config(state="disabled")
+        else:
+            self.root.after(0, lambda: messagebox.showerror("Error", "Failed to start charging"))
     
     def stop_battery_charging(self):
         """Stop battery charging."""
@@ -1043,20 +1364,24 @@ class OwonPSUGUI:
             return
             
         if messagebox.askyesno("Confirm Stop", "Stop charging and safely discharge?"):
-            self.battery_charger.stop_charging()
-            self.charge_status.set("Stopped")
-            self.charge_status_label.config(foreground="orange")
-            self.start_charge_btn.config(state="normal")
-            self.stop_charge_btn.config(state="disabled")
-            self.battery_type_combo.config(state="readonly")
-            self.charge_channel_combo.config(state="readonly")
-            self.charge_time.set("00:00")
+            self.loop.create_task(self._stop_battery_charging())
+    
+    async def _stop_battery_charging(self):
+        """Stop charging and update the charging controls."""
+        await self.battery_charger.stop_charging()
+        self.charge_status.set("Stopped")
+        self.charge_status_label.config(foreground="orange")
+        self.start_charge_btn.config(state="normal")
+        self.stop_charge_btn.config(state="disabled")
+        self.battery_type_combo.config(state="readonly")
+        self.charge_channel_combo.config(state="readonly")
+        self.charge_time.set("00:00")
     
-    def update_charge_status(self):
+    async def update_charge_status(self):
         """Update charging status and time."""
         if self.battery_charger.charging:
             # Check if charging is complete
-            if self.battery_charger.check_charge_complete():
+            if await self.battery_charger.check_charge_complete():
                 self.charge_status.set("Complete")
                 self.charge_status_label.config(foreground="blue")
                 self.start_charge_btn.config(state="normal")
@@ -1068,7 +1393,10 @@ class OwonPSUGUI:
                 charge_time_min = self.battery_charger.get_charge_time()
                 hours = int(charge_time_min // 60)
                 minutes = int(charge_time_min % 60)
-                self.charge_time.set(f"{hours:02d}:{minutes:02d}")
+                # The label only changes once a minute; skip redundant redraws
+                text = f"{hours:02d}:{minutes:02d}"
+                if self.charge_time.get() != text:
+                    self.charge_time.set(text)
 
 def main():
     """Main function."""
@@ -1077,7 +1405,7 @@ def main():
     
     # Handle window closing
     def on_closing():
-        app.monitoring = False
+        app.stop_monitoring()
         if app.connected and app.psu:
             try:
                 app.psu.close()
@@ -4,11 +4,38 @@ Command Line Interface for OWON PSU Control Library
 """
 
 import argparse
+import csv
+import json
+import os
+import socket
 import sys
 import time
-from typing import Optional
+from array import array
+from typing import Optional, TYPE_CHECKING
 
-from . import OwonPSU, OwonPSUError
+if TYPE_CHECKING:
+    from . import OwonPSU
+
+# Monitor table row, and how many rows / seconds of output to buffer
+MONITOR_ROW = "{:6.1f} {:8.3f} {:8.3f} {:8.3f} {:>6}\n"
+MONITOR_FLUSH_ROWS = 10
+MONITOR_FLUSH_INTERVAL = 1.0
+
+# Columns of the monitor CSV export
+MONITOR_CSV_HEADER = ('time', 'voltage', 'current', 'power', 'output')
+
+# Name of the Unix socket a --daemon listens on, kept in a per-user directory
+DAEMON_SOCKET_NAME = 'owon-psu.sock'
+
+# PSU methods a daemon serves to CLI invocations
+DAEMON_METHODS = frozenset([
+    'get_identity', 'get_voltage_limit', 'get_current_limit', 'get_device_info',
+    'get_measurement_status', 'reset', 'write', 'write_many', 'safe_shutdown',
+])
+
+
+class SetpointError(Exception):
+    """A requested setpoint is outside the range the device accepts."""
 
 
 def main():
@@ -21,6 +48,9 @@ Examples:
   # Serial connection
   owon-psu --port COM3 --serial
   
+  # Serial connection without the USB-serial latency timer delay (Linux)
+  owon-psu --port /dev/ttyUSB0 --serial --low-latency
+  
   # Network connection
   owon-psu --ip 192.168.1.100 --port 3000 --network
   
@@ -32,17 +62,35 @@ Examples:
   
   # Monitor measurements
   owon-psu --port COM3 --monitor --duration 10
+  
+  # Monitor at 10 samples per second
+  owon-psu --port COM3 --monitor --interval 0.1
+  
+  # Monitor and save the samples as CSV
+  owon-psu --port COM3 --monitor --duration 60 --csv samples.csv
+  
+  # Keep the connection open; later invocations go through the daemon
+  owon-psu --port /dev/ttyUSB0 --serial --daemon &
+  owon-psu --voltage 5.0 --enable
         """
     )
     
     # Connection arguments
-    connection_group = parser.add_mutually_exclusive_group(required=True)
+    connection_group = parser.add_mutually_exclusive_group()
     connection_group.add_argument('--serial', action='store_true', help='Use serial connection')
     connection_group.add_argument('--network', action='store_true', help='Use network connection')
     
     # Serial connection arguments
     parser.add_argument('--port', type=str, help='Serial port (e.g., COM3) or network port number')
     parser.add_argument('--ip', type=str, help='IP address for network connection')
+    parser.add_argument('--timeout', type=float, default=1.0, help='Communication timeout in seconds')
+    parser.add_argument('--low-latency', action='store_true',
+                        help='Enable low-latency mode on USB-serial adapters (Linux)')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep the connection open and serve other owon-psu invocations over --sock')
+    parser.add_argument('--sock', type=str, metavar='PATH',
+                        help=f'Unix socket of the daemon (default: {DAEMON_SOCKET_NAME} in '
+                             '$XDG_RUNTIME_DIR, or ~/.cache/owon-psu)')
     
     # Operation arguments
     parser.add_argument('--info', action='store_true', help='Get device information')
@@ -52,13 +100,42 @@ Examples:
     parser.add_argument('--disable', action='store_true', help='Disable output')
     parser.add_argument('--monitor', action='store_true', help='Monitor measurements')
     parser.add_argument('--duration', type=int, default=10, help='Monitoring duration in seconds')
+    parser.add_argument('--interval', type=float, default=1.0, help='Monitoring sample interval in seconds')
+    parser.add_argument('--csv', type=str, metavar='PATH', help='Save monitored samples to a CSV file')
     parser.add_argument('--reset', action='store_true', help='Reset device')
     parser.add_argument('--shutdown', action='store_true', help='Safe shutdown')
+    parser.add_argument('--no-batch', action='store_true',
+                        help='Send reset and settings as separate commands, without probing for compound command support')
     
     args = parser.parse_args()
     
+    if args.interval <= 0:
+        parser.error("--interval must be positive")
+    
+    # Imported only after argument parsing, so --help and usage errors
+    # do not load the connection code
+    from . import OwonPSUError
+    
+    if args.daemon and not hasattr(socket, 'AF_UNIX'):
+        parser.error("--daemon needs Unix domain sockets, which this platform does not provide")
+    
+    # Use a running daemon only when no connection of our own was asked
+    # for, or when its socket was named explicitly
+    explicit_sock = args.sock is not None
+    if not explicit_sock:
+        args.sock = default_daemon_socket()
+    client = None
+    if not args.daemon and (explicit_sock or not (args.serial or args.network)):
+        client = _connect_daemon(args.sock)
+    if client is None and not (args.serial or args.network):
+        parser.error("one of the arguments --serial --network is required")
+    
     try:
-        if args.serial:
+        if client is not None:
+            print(f"Using daemon at {args.sock}", file=sys.stderr)
+            with client:
+                run_operations(client, args)
+        elif args.serial:
             if not args.port:
                 parser.error("--port is required for serial connection")
             run_serial_connection(args)
@@ -67,6 +144,8 @@ Examples:
                 parser.error("--ip and --port are required for network connection")
             run_network_connection(args)
             
+    except SetpointError as e:
+        parser.error(str(e))
     except OwonPSUError as e:
         print(f"PSU Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -80,64 +159,246 @@ Examples:
 
 def run_serial_connection(args):
     """Run serial connection operations."""
-    with OwonPSU(args.port, serial=True) as psu:
-        run_operations(psu, args)
+    from . import OwonPSU
+    
+    with OwonPSU(args.port, serial=True, timeout=args.timeout) as psu:
+        if args.low_latency and not psu.set_low_latency():
+            print("Low-latency mode not supported on this port", file=sys.stderr)
+        (serve_daemon if args.daemon else run_operations)(psu, args)
 
 
 def run_network_connection(args):
     """Run network connection operations."""
-    psu = OwonPSU("COM1", serial=False)  # port not used for network
+    from . import OwonPSU
+    
+    psu = OwonPSU("COM1", serial=False, timeout=args.timeout)  # port not used for network
     psu.open_network(args.ip, int(args.port))
     
     try:
-        run_operations(psu, args)
+        (serve_daemon if args.daemon else run_operations)(psu, args)
     finally:
         psu.close()
 
 
-def run_operations(psu: OwonPSU, args):
+def serve_daemon(psu: 'OwonPSU', args):
+    """
+    Serve PSU calls to other CLI invocations over a Unix domain socket.
+    
+    Runs until interrupted. Clients are handled one at a time, so each
+    invocation has the PSU to itself while it is connected.
+    """
+    path = args.sock
+    print(f"Connected to: {psu.get_identity()}")
+    
+    os.makedirs(os.path.dirname(path) or '.', mode=0o700, exist_ok=True)
+    if os.path.exists(path):
+        client = _connect_daemon(path)
+        if client is not None:
+            client.close()
+            sys.exit(f"A daemon is already listening on {path}")
+        os.unlink(path)  # Left behind by a daemon that did not exit cleanly
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # Socket is usable by the owner only
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    
+    try:
+        server.listen()
+        print(f"Serving on {path} (Ctrl+C to stop)", flush=True)
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                _handle_daemon_client(psu, conn)
+    finally:
+        server.close()
+        os.unlink(path)
+
+
+def _handle_daemon_client(psu: 'OwonPSU', conn: socket.socket):
+    """Answer one client's requests, one JSON object per line, until it disconnects."""
+    from . import OwonPSUError
+    
+    try:
+        with conn.makefile('rwb') as stream:
+            for line in stream:
+                try:
+                    request = json.loads(line)
+                    method = request['method']
+                    if method not in DAEMON_METHODS:
+                        raise ValueError(f"method not served: {method}")
+                    reply = {'result': getattr(psu, method)(*request.get('args', []))}
+                except OwonPSUError as e:
+                    reply = {'error': str(e)}
+                except (ValueError, KeyError, TypeError) as e:
+                    reply = {'error': f"Bad request: {e}"}
+                stream.write(json.dumps(reply).encode() + b'\n')
+                stream.flush()
+    except OSError:
+        pass  # Client went away mid-request
+
+
+def default_daemon_socket() -> str:
+    """Return the daemon socket path in the user's runtime or cache directory."""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, DAEMON_SOCKET_NAME)
+    return os.path.join(os.path.expanduser('~'), '.cache', 'owon-psu', DAEMON_SOCKET_NAME)
+
+
+def _connect_daemon(path: str) -> Optional['DaemonClient']:
+    """
+    Connect to the daemon at path, or return None if none is running there.
+    
+    Sockets owned by another user are ignored, so a socket planted in a
+    shared directory cannot capture our commands.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    try:
+        owner = os.stat(path).st_uid
+    except OSError:
+        return None
+    if hasattr(os, 'getuid') and owner != os.getuid():
+        print(f"Ignoring daemon socket {path}: owned by another user", file=sys.stderr)
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return DaemonClient(sock)
+
+
+class DaemonClient:
+    """
+    Stand-in for OwonPSU that forwards calls to a running daemon.
+    
+    Only the methods in DAEMON_METHODS are available; errors reported by the
+    daemon are raised as OwonPSUError.
+    """
+    
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._stream = sock.makefile('rwb')
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def close(self) -> None:
+        self._stream.close()
+        self._sock.close()
+    
+    def call(self, method: str, *args):
+        """Run one PSU method in the daemon and return its result."""
+        from . import OwonPSUError
+        
+        self._stream.write(json.dumps({'method': method, 'args': args}).encode() + b'\n')
+        self._stream.flush()
+        line = self._stream.readline()
+        if not line:
+            raise OwonPSUError("Daemon closed the connection")
+        reply = json.loads(line)
+        if 'error' in reply:
+            raise OwonPSUError(reply['error'])
+        return reply['result']
+    
+    def __getattr__(self, name):
+        if name not in DAEMON_METHODS:
+            raise AttributeError(name)
+        return lambda *args: self.call(name, *args)
+    
+    def get_measurement_status(self):
+        """Measurement comes back as a JSON list; rebuild the named tuple."""
+        from . import Measurement
+        return Measurement(*self.call('get_measurement_status'))
+
+
+def run_operations(psu: 'OwonPSU', args):
     """Run the requested operations."""
     print(f"Connected to: {psu.get_identity()}")
     
+    # A zero --voltage/--current is still a request, so test for None
+    any_action = any([args.info, args.voltage is not None, args.current is not None, args.enable,
+                      args.disable, args.monitor, args.shutdown, args.reset])
+    
+    # Reject out-of-range setpoints before anything is sent
+    if args.voltage is not None:
+        _check_setpoint(args.voltage, psu.get_voltage_limit, "Voltage", "V")
+    if args.current is not None:
+        _check_setpoint(args.current, psu.get_current_limit, "Current", "A")
+    
+    # Reset and settings go out as one compound write on devices that
+    # accept them (write_many() checks first); *WAI makes the device
+    # finish the reset before it applies the settings
+    commands = []
     if args.reset:
         print("Resetting device...")
-        psu.reset()
-        time.sleep(0.5)
-    
-    if args.info:
-        print_device_info(psu)
+        commands += ["*RST", "*WAI"]
     
     if args.voltage is not None:
         print(f"Setting voltage to {args.voltage}V...")
-        psu.set_voltage(args.voltage)
+        commands.append(f"VOLTage {args.voltage:.3f}")
     
     if args.current is not None:
         print(f"Setting current to {args.current}A...")
-        psu.set_current(args.current)
+        commands.append(f"CURRent {args.current:.3f}")
     
     if args.enable:
         print("Enabling output...")
-        psu.set_output(True)
+        commands.append("OUTPut ON")
     
     if args.disable:
         print("Disabling output...")
-        psu.set_output(False)
+        commands.append("OUTPut OFF")
+    
+    if commands:
+        if args.no_batch:
+            for command in commands:
+                if command == "*RST":
+                    psu.reset()
+                else:
+                    psu.write(command)
+        else:
+            psu.write_many(commands)
+    
+    if args.info:
+        print_device_info(psu)
     
     if args.monitor:
         print(f"Monitoring for {args.duration} seconds...")
-        monitor_measurements(psu, args.duration)
+        monitor_measurements(psu, args.duration, args.interval, args.csv)
     
     if args.shutdown:
         print("Performing safe shutdown...")
         psu.safe_shutdown()
     
     # If no specific operation was requested, show current status
-    if not any([args.info, args.voltage, args.current, args.enable, 
-                args.disable, args.monitor, args.shutdown, args.reset]):
+    if not any_action:
         print_current_status(psu)
 
 
-def print_device_info(psu: OwonPSU):
+def _check_setpoint(value: float, get_limit, name: str, unit: str):
+    """Raise SetpointError if value is negative or above the device limit."""
+    from . import OwonPSUError
+    
+    if value < 0:
+        raise SetpointError(f"{name} must not be negative: {value}{unit}")
+    try:
+        limit = get_limit()
+    except (OwonPSUError, ValueError):
+        return  # Limit not readable on this device; let the PSU decide
+    if value > limit:
+        raise SetpointError(f"{name} {value}{unit} exceeds the device limit of {limit:.3f}{unit}")
+
+
+def print_device_info(psu: 'OwonPSU'):
     """Print comprehensive device information."""
     device_info = psu.get_device_info()
     
@@ -156,39 +417,99 @@ def print_device_info(psu: OwonPSU):
         print("No errors detected")
 
 
-def print_current_status(psu: OwonPSU):
+def print_current_status(psu: 'OwonPSU'):
     """Print current device status."""
     status = psu.get_measurement_status()
     
     print("\n=== Current Status ===")
-    print(f"Voltage: {status['voltage']:.3f}V (set: {status['set_voltage']:.3f}V)")
-    print(f"Current: {status['current']:.3f}A (set: {status['set_current']:.3f}A)")
-    print(f"Power: {status['power']:.3f}W")
-    print(f"Output: {'ON' if status['output_enabled'] else 'OFF'}")
+    print(f"Voltage: {status.voltage:.3f}V (set: {status.set_voltage:.3f}V)")
+    print(f"Current: {status.current:.3f}A (set: {status.set_current:.3f}A)")
+    print(f"Power: {status.power:.3f}W")
+    print(f"Output: {'ON' if status.output_enabled else 'OFF'}")
 
 
-def monitor_measurements(psu: OwonPSU, duration: int):
-    """Monitor measurements for specified duration."""
+def monitor_measurements(psu: 'OwonPSU', duration: int, interval: float = 1.0,
+                         csv_path: Optional[str] = None):
+    """
+    Monitor measurements for specified duration.
+    
+    Samples are scheduled on fixed deadlines, so query time does not add up
+    over the run; if a query overruns the interval the schedule restarts
+    from now instead of firing the missed samples back to back.
+    
+    Rows are written in batches of MONITOR_FLUSH_ROWS, or at least every
+    MONITOR_FLUSH_INTERVAL seconds, instead of one write per sample.
+    
+    With csv_path, the samples are also kept in one typed array per column
+    and saved as CSV when monitoring ends.
+    """
     print(f"{'Time':>6} {'Voltage':>8} {'Current':>8} {'Power':>8} {'Output':>6}")
-    print("-" * 40)
+    print("-" * 40, flush=True)
     
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        try:
-            status = psu.get_measurement_status()
-            elapsed = time.time() - start_time
-            
-            print(f"{elapsed:6.1f} {status['voltage']:8.3f} {status['current']:8.3f} "
-                  f"{status['power']:8.3f} {'ON' if status['output_enabled'] else 'OFF':>6}")
-            
-            time.sleep(1)
+    rows = []
+    format_row = MONITOR_ROW.format
+    if csv_path:
+        columns = (array('d'), array('d'), array('d'), array('d'), array('b'))
+        times, voltages, currents, powers, outputs = columns
+    start_time = now = next_sample = time.monotonic()
+    last_flush = start_time - MONITOR_FLUSH_INTERVAL  # Show the first row at once
+    try:
+        while now - start_time < duration:
+            try:
+                status = psu.get_measurement_status()
+                
+                # One clock read per sample; after sleeping, the deadline
+                # stands in for the current time
+                now = time.monotonic()
+                rows.append(format_row(now - start_time, status.voltage, status.current,
+                                       status.power, 'ON' if status.output_enabled else 'OFF'))
+                if csv_path:
+                    times.append(now - start_time)
+                    voltages.append(status.voltage)
+                    currents.append(status.current)
+                    powers.append(status.power)
+                    outputs.append(status.output_enabled)
+                if len(rows) >= MONITOR_FLUSH_ROWS or now - last_flush >= MONITOR_FLUSH_INTERVAL:
+                    _write_rows(rows)
+                    last_flush = now
+                
+                next_sample += interval
+                delay = next_sample - now
+                if delay > 0:
+                    time.sleep(delay)
+                    now = next_sample
+                else:
+                    next_sample = now
             
-        except KeyboardInterrupt:
-            print("\nMonitoring interrupted by user")
-            break
-        except Exception as e:
-            print(f"\nMonitoring error: {e}")
-            break
+            except KeyboardInterrupt:
+                _write_rows(rows)
+                print("\nMonitoring interrupted by user")
+                break
+            except Exception as e:
+                _write_rows(rows)
+                print(f"\nMonitoring error: {e}")
+                break
+    finally:
+        _write_rows(rows)
+        if csv_path:
+            _write_csv(csv_path, columns)
+            print(f"Saved {len(times)} samples to {csv_path}")
+
+
+def _write_rows(rows: list):
+    """Write buffered monitor rows to stdout in one call."""
+    if rows:
+        sys.stdout.write("".join(rows))
+        sys.stdout.flush()
+        rows.clear()
+
+
+def _write_csv(path: str, columns: tuple):
+    """Write monitor samples, stored one array per column, as CSV."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(MONITOR_CSV_HEADER)
+        writer.writerows(zip(*columns))
 
 
 if __name__ == "__main__":
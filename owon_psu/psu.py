@@ -0,0 +1,1087 @@
+#!/usr/bin/env python3
+"""
+OWON PSU driver: the OwonPSU class and its supporting types.
+
+Imported on first use of these names from the owon_psu package.
+"""
+
+import functools
+import serial
+import socket
+import time
+from typing import NamedTuple, Optional, Union, Tuple
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=256)
+def _encode_command(command: str) -> bytes:
+    """Encode a command line; repeated commands such as polling queries reuse the cached bytes."""
+    # SCPI is ASCII-only; a stray non-ASCII character fails the send
+    # instead of reaching the device as multi-byte garbage
+    return command.encode('ascii') + b'\n'
+
+def _join_commands(commands: list) -> str:
+    """
+    Chain SCPI commands into one compound command line.
+    
+    ';:' resets the header path before each command; common commands
+    (*RST, *WAI, ...) have no header path and follow a plain ';'.
+    """
+    parts = []
+    for command in commands:
+        if parts:
+            parts.append(';' if command.lstrip().startswith('*') else ';:')
+        parts.append(command)
+    return ''.join(parts)
+
+def _is_no_error(error: str) -> bool:
+    """Check for an empty error queue reply such as '0,"No error"' or '+0,No error'."""
+    if "no error" in error.lower():
+        return True
+    try:
+        return int(error.split(',', 1)[0]) == 0
+    except ValueError:
+        return False
+
+class OwonPSUError(Exception):
+    """Custom exception for OWON PSU errors."""
+    pass
+
+class Measurement(NamedTuple):
+    """
+    Measurement status returned by OwonPSU.get_measurement_status().
+    
+    Fields are read as attributes (status.voltage). For code written against
+    the dictionary returned by earlier versions, status['voltage'],
+    'voltage' in status, get(), keys(), values() and items() also work.
+    Unlike a dict, iterating over a Measurement yields the values, as for
+    any tuple; use keys() to iterate over the field names.
+    """
+    voltage: float
+    current: float
+    power: float
+    output_enabled: bool
+    set_voltage: float
+    set_current: float
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+    
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return key in self._fields
+        return tuple.__contains__(self, key)
+    
+    def get(self, key, default=None):
+        """Return the named field, or default if there is no such field."""
+        try:
+            return self[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+    
+    def keys(self):
+        """Return the field names, as dict.keys() did for the old status dict."""
+        return self._fields
+    
+    def values(self):
+        """Return the field values in field order."""
+        return tuple(self)
+    
+    def items(self):
+        """Return (field name, value) pairs, as dict.items() did."""
+        return tuple(zip(self._fields, self))
+
+class OwonPSU:
+    """
+    OWON Power Supply Unit Control Class
+    
+    Supports both serial and network connections to OWON PSU devices.
+    Implements standard SCPI commands for power supply control.
+    """
+    
+    # Supported OWON device identifiers
+    SUPPORTED_DEVICES = {
+        "OWON,SPE",      # SPE series
+        "OWON,SPM",      # SPM series  
+        "OWON,P4",       # P4000 series
+        "OWON,P3",       # P3000 series
+        "OWON,P2",       # P2000 series
+        "OWON,P1",       # P1000 series
+        "KIPRIM,DC",     # KIPRIM DC series
+        "OWON,ODP",      # ODP series
+        "OWON,ODS"       # ODS series
+    }
+    
+    # Default communication settings
+    DEFAULT_BAUDRATE = 115200
+    DEFAULT_NETWORK_PORT = 3000
+    DEFAULT_TIMEOUT = 1.0
+    
+    # TCP keepalive for network connections: idle time, probe interval (s), probe count
+    KEEPALIVE_IDLE = 30
+    KEEPALIVE_INTERVAL = 10
+    KEEPALIVE_COUNT = 3
+    
+    # Lifetime (s) of cached replies for settings that rarely change
+    LIMIT_CACHE_TTL = 30.0
+    MODE_CACHE_TTL = 5.0
+    
+    # Silence (s) that ends the discarding of a reply still arriving
+    DRAIN_QUIET_TIME = 0.1
+    
+    # Compound queries that may fail without a reply (e.g. a timeout) before
+    # compound commands are given up on
+    CONCAT_MAX_FAILURES = 3
+    
+    def __init__(self, port: str, serial: bool = True, timeout: float = DEFAULT_TIMEOUT,
+                 baudrate: int = DEFAULT_BAUDRATE):
+        """
+        Initialize OWON PSU connection.
+        
+        Args:
+            port (str): Serial port name (e.g., "COM3") or network port number
+            serial (bool): True for serial connection, False for network
+            timeout (float): Communication timeout in seconds
+            baudrate (int): Serial baud rate; must match the rate set on the PSU
+        """
+        self.port = port
+        self.serial = serial
+        self.network = not serial
+        self.timeout = timeout
+        self.baudrate = baudrate
+        self.connection = None
+        self.device_info = None
+        
+        # Connection state
+        self._connected = False
+        self._connection_type = None
+        
+        # Bytes received from the network but not yet returned as a line
+        self._rx_buf = bytearray()
+        
+        # Whether the device accepts ';'-chained commands (None: not yet known)
+        self._supports_concat = None
+        self._concat_failures = 0
+        
+        # Session cache: key -> (value, expiry time or None for the session)
+        self._cache = {}
+        self.cache_hit_total = 0
+        self.cache_miss_total = 0
+    
+    def __enter__(self):
+        """Context manager entry."""
+        if self.serial:
+            self.open_serial()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    def open_serial(self) -> None:
+        """
+        Open serial connection to the PSU.
+        
+        Raises:
+            OwonPSUError: If connection fails or device is not supported
+        """
+        try:
+            self.connection = serial.Serial(
+                port=self.port,
+                baudrate=self.baudrate,
+                timeout=self.timeout,
+                bytesize=serial.EIGHTBITS,
+                parity=serial.PARITY_NONE,
+                stopbits=serial.STOPBITS_ONE
+            )
+            self._connected = True
+            self._connection_type = 'serial'
+            self._supports_concat = None
+            self._concat_failures = 0
+            
+            # Verify device identity
+            self._verify_device()
+            logger.info(f"Serial connection established to {self.port}")
+            
+        except serial.SerialException as e:
+            raise OwonPSUError(f"Failed to open serial connection: {e}")
+    
+    def set_low_latency(self, enabled: bool = True) -> bool:
+        """
+        Enable or disable low-latency mode on a serial connection.
+        
+        USB-serial adapters hold received bytes for up to their latency
+        timer (16 ms by default on FTDI chips) before passing them on, which
+        dominates the round-trip time of short SCPI replies. Low-latency mode
+        asks the driver to deliver them immediately (Linux only).
+        
+        Args:
+            enabled (bool): True to enable low-latency mode, False to disable
+        
+        Returns:
+            bool: True if the mode was changed, False if unsupported
+        """
+        if self._connection_type != 'serial':
+            return False
+        
+        try:
+            self.connection.set_low_latency_mode(enabled)
+            return True
+        except (AttributeError, NotImplementedError, ValueError) as e:
+            logger.debug(f"Low-latency mode not available on {self.port}: {e}")
+            return False
+    
+    def open_network(self, ip_address: str, port: int = DEFAULT_NETWORK_PORT) -> None:
+        """
+        Open network connection to the PSU.
+        
+        Args:
+            ip_address (str): IP address of the PSU
+            port (int): Network port (default: 3000)
+            
+        Raises:
+            OwonPSUError: If connection fails or device is not supported
+        """
+        try:
+            self._rx_buf.clear()
+            self.connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.connection.settimeout(self.timeout)
+            self._configure_socket(self.connection)
+            self.connection.connect((ip_address, port))
+            self._connected = True
+            self._connection_type = 'network'
+            self._supports_concat = None
+            self._concat_failures = 0
+            
+            # Verify device identity
+            self._verify_device()
+            logger.info(f"Network connection established to {ip_address}:{port}")
+            
+        except socket.error as e:
+            raise OwonPSUError(f"Failed to open network connection: {e}")
+    
+    def _configure_socket(self, sock: socket.socket) -> None:
+        """
+        Tune a network socket for short SCPI request/response exchanges.
+        
+        TCP_NODELAY disables Nagle's algorithm so each query goes out at once
+        instead of waiting for the previous segment to be acknowledged; this
+        costs a few more small packets but keeps query latency down to the
+        network round trip. Keepalive probes detect a half-open link during
+        long unattended sessions before the next command times out.
+        
+        Args:
+            sock (socket.socket): Socket to configure
+        """
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        
+        # Keepalive timing options are platform specific (Linux and others)
+        for option, value in (('TCP_KEEPIDLE', self.KEEPALIVE_IDLE),
+                              ('TCP_KEEPINTVL', self.KEEPALIVE_INTERVAL),
+                              ('TCP_KEEPCNT', self.KEEPALIVE_COUNT)):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+    
+    def close(self) -> None:
+        """Close the connection to the PSU."""
+        self.clear_cache()
+        self._rx_buf.clear()
+        if self.connection:
+            try:
+                self.connection.close()
+                self._connected = False
+                self._connection_type = None
+                logger.info("Connection closed")
+            except Exception as e:
+                logger.warning(f"Error closing connection: {e}")
+    
+    def _verify_device(self) -> None:
+        """
+        Verify that the connected device is a supported OWON PSU.
+        
+        Raises:
+            OwonPSUError: If device is not supported
+        """
+        try:
+            # Discard anything the device sent before we connected
+            self._drain_input()
+            identity = self.query("*IDN?")
+            self.device_info = identity.strip()
+            self._cache['identity'] = (identity, None)
+            
+            if not any(device in identity for device in self.SUPPORTED_DEVICES):
+                raise OwonPSUError(f"Unsupported device: {identity}")
+                
+            logger.info(f"Connected to: {identity}")
+            
+        except Exception as e:
+            raise OwonPSUError(f"Device verification failed: {e}")
+    
+    def _send_command(self, command: str) -> None:
+        """
+        Send a command to the PSU.
+        
+        Args:
+            command (str): SCPI command to send
+            
+        Raises:
+            OwonPSUError: If command fails
+        """
+        if not self._connected:
+            raise OwonPSUError("Not connected to PSU")
+        
+        try:
+            # Hand the whole line to the OS in one call; pyserial writes
+            # straight to the file descriptor, sendall() guards against
+            # partial sends on sockets
+            data = _encode_command(command)
+            if self._connection_type == 'serial':
+                self.connection.write(data)
+            else:  # network
+                self.connection.sendall(data)
+                
+        except Exception as e:
+            raise OwonPSUError(f"Failed to send command '{command}': {e}")
+    
+    def query(self, command: str, cache_ttl: Optional[float] = None) -> str:
+        """
+        Send a query command and return the response.
+        
+        Args:
+            command (str): SCPI query command
+            cache_ttl (float, optional): Reuse the last response to this
+                command for up to this many seconds; any write invalidates it
+            
+        Returns:
+            str: Device response
+            
+        Raises:
+            OwonPSUError: If query fails
+        """
+        if cache_ttl is not None:
+            return self._cached(command, lambda: self.query(command), cache_ttl)
+        
+        response = self._exchange(command)
+        
+        # Check for errors
+        if response == "ERR":
+            raise OwonPSUError(f"Device returned error for command: {command}")
+        
+        return response
+    
+    def _exchange(self, command: str) -> str:
+        """Send a command and return its reply line, including an ERR reply."""
+        if not self._connected:
+            raise OwonPSUError("Not connected to PSU")
+        
+        try:
+            # Drop stale bytes (e.g. a late reply to an earlier query) so
+            # they are not read as this query's reply; a single tcflush
+            if self._connection_type == 'serial':
+                self.connection.reset_input_buffer()
+            
+            # Send command
+            self._send_command(command)
+            
+            # Read response; readline() returns as soon as the newline
+            # arrives, the timeout only bounds a missing reply
+            if self._connection_type == 'serial':
+                response = self.connection.readline().decode('utf-8').strip()
+            else:  # network
+                response = self._readline_network().decode('utf-8').strip()
+            
+            return response
+            
+        except Exception as e:
+            # A late reply to this query must not be read as the next one's
+            self._drain_input()
+            raise OwonPSUError(f"Query failed for '{command}': {e}")
+    
+    def _readline_network(self) -> bytes:
+        """
+        Read one newline-terminated reply from the network connection.
+        
+        TCP may split a reply across several segments or deliver several
+        replies in one, so data is collected in a receive buffer and any
+        bytes after the first newline are kept for the next call.
+        
+        Returns:
+            bytes: The reply line without its terminator
+        
+        Raises:
+            OwonPSUError: If the device closes the connection
+        """
+        buf = self._rx_buf
+        scanned = 0
+        while True:
+            end = buf.find(b'\n', scanned)
+            if end >= 0:
+                line = bytes(buf[:end])
+                del buf[:end + 1]
+                return line
+            scanned = len(buf)
+            data = self.connection.recv(4096)
+            if not data:
+                raise OwonPSUError("Connection closed by device")
+            buf += data
+    
+    def _drain_input(self, quiet: float = 0.0) -> None:
+        """
+        Discard received data that has not been read yet.
+        
+        Args:
+            quiet (float): Keep discarding until nothing has arrived for this
+                many seconds (default: only what is already buffered)
+        """
+        self._rx_buf.clear()
+        try:
+            if self._connection_type == 'serial':
+                self.connection.reset_input_buffer()
+                while quiet > 0:
+                    time.sleep(quiet)
+                    if not self.connection.in_waiting:
+                        break
+                    self.connection.reset_input_buffer()
+            elif self._connection_type == 'network':
+                # A zero timeout makes the socket non-blocking
+                self.connection.settimeout(quiet)
+                try:
+                    while self.connection.recv(4096):
+                        pass
+                except (BlockingIOError, socket.timeout):
+                    pass
+                finally:
+                    self.connection.settimeout(self.timeout)
+        except (OSError, serial.SerialException) as e:
+            logger.debug(f"Failed to drain input: {e}")
+    
+    def query_multi(self, commands: list) -> list:
+        """
+        Send several commands as one compound SCPI query.
+        
+        The commands are chained with ';:' (';' before common commands such
+        as *OPC?) and sent in a single round-trip;
+        commands without a '?' (e.g. channel selection) produce no reply.
+        If the device answers the first compound query with an error, no
+        reply or too few values but the commands succeed one at a time, it is
+        treated as not supporting compound commands and later calls send them
+        individually. A compound query that fails without any reply (e.g. a
+        network timeout) may be transient, so that only happens after
+        CONCAT_MAX_FAILURES of them.
+        
+        Args:
+            commands (list): SCPI commands, in order
+        
+        Returns:
+            list: One response string per query in commands
+        
+        Raises:
+            OwonPSUError: If the query fails or the reply count does not match
+        """
+        if self._supports_concat is False:
+            return self._query_each(commands)
+        
+        compound = _join_commands(commands)
+        expected = sum(1 for command in commands if command.rstrip().endswith('?'))
+        try:
+            response = self._exchange(compound)
+        except OwonPSUError:
+            if self._supports_concat is not None:
+                raise
+            values = self._query_each(commands)
+            self._concat_failures += 1
+            if self._concat_failures >= self.CONCAT_MAX_FAILURES:
+                self._supports_concat = False
+                logger.info("Compound commands keep failing; sending them individually")
+            return values
+        
+        values = [value.strip() for value in response.split(';')]
+        if response and response != "ERR" and len(values) == expected:
+            self._supports_concat = True
+            return values
+        
+        # Replies that are still on their way would be read as the answers
+        # to later queries
+        self._drain_input(self.DRAIN_QUIET_TIME)
+        if self._supports_concat is not None:
+            if response == "ERR":
+                raise OwonPSUError(f"Device returned error for command: {compound}")
+            raise OwonPSUError(f"Expected {expected} values in compound response: {response}")
+        values = self._query_each(commands)
+        self._supports_concat = False
+        logger.info("Device does not accept compound commands; sending them individually")
+        return values
+    
+    def _query_each(self, commands: list) -> list:
+        """Send commands one at a time, returning the replies to the queries."""
+        values = []
+        for command in commands:
+            if command.rstrip().endswith('?'):
+                values.append(self.query(command))
+            else:
+                self.write(command)
+        return values
+    
+    def write(self, command: str, settle: float = 0.0) -> None:
+        """
+        Send a command without expecting a response.
+        
+        The call returns as soon as the command is sent; commands the device
+        needs time to act on should pass a settle delay or be followed by
+        wait_for_opc().
+        
+        Args:
+            command (str): SCPI command to send
+            settle (float): Seconds to wait after sending (default: none)
+            
+        Raises:
+            OwonPSUError: If command fails
+        """
+        self._send_command(command)
+        if settle > 0:
+            time.sleep(settle)
+        
+        # Commands may change output state, limits, modes or the error
+        # queue; only session-long entries (identity) survive
+        self._cache = {key: entry for key, entry in self._cache.items() if entry[1] is None}
+    
+    def write_many(self, commands: list, settle: float = 0.0) -> None:
+        """
+        Send several commands as a single compound SCPI write.
+        
+        The commands are chained with ';:' (';' before common commands such
+        as *WAI) so they cost one transfer instead
+        of one per command. Firmware without compound command support drops
+        such lines silently, so support is first probed with a short
+        compound query; unless it is confirmed, the commands are sent one at
+        a time.
+        
+        Args:
+            commands (list): SCPI commands to send, in order
+            settle (float): Seconds to wait after sending (default: none)
+        
+        Raises:
+            OwonPSUError: If command fails
+        """
+        if any(command.strip().upper() == "*RST" for command in commands):
+            self.clear_cache()
+        if self._supports_concat is None and len(commands) > 1:
+            self._probe_concat()
+        if self._supports_concat:
+            self.write(_join_commands(commands), settle)
+        else:
+            for command in commands:
+                self.write(command)
+            if settle > 0:
+                time.sleep(settle)
+    
+    def _probe_concat(self) -> None:
+        """Find out whether the device accepts compound commands (see query_multi())."""
+        try:
+            self.query_multi(["VOLTage?", "CURRent?"])
+        except OwonPSUError as e:
+            logger.debug(f"Compound command probe failed: {e}")
+    
+    def _cached(self, key: str, fetch, ttl: Optional[float] = None):
+        """
+        Return a cached value, fetching and storing it on a miss.
+        
+        Args:
+            key (str): Cache key
+            fetch (callable): Function returning the value on a cache miss
+            ttl (float, optional): Seconds the value stays valid; None keeps
+                it until the cache is cleared
+        
+        Returns:
+            The cached or freshly fetched value
+        """
+        entry = self._cache.get(key)
+        if entry is not None and (entry[1] is None or time.monotonic() < entry[1]):
+            self.cache_hit_total += 1
+            return entry[0]
+        
+        self.cache_miss_total += 1
+        value = fetch()
+        expires = None if ttl is None else time.monotonic() + ttl
+        self._cache[key] = (value, expires)
+        return value
+    
+    def clear_cache(self) -> None:
+        """Drop cached identity and query replies."""
+        self._cache.clear()
+    
+    # ============================================================================
+    # SYSTEM COMMANDS
+    # ============================================================================
+    
+    def get_identity(self) -> str:
+        """Get device identification string (cached for the session)."""
+        return self._cached('identity', lambda: self.query("*IDN?"))
+    
+    def reset(self) -> None:
+        """Reset the device to default settings."""
+        self.clear_cache()
+        self.write("*RST", settle=0.1)  # Allow time for reset
+    
+    def clear_status(self) -> None:
+        """Clear status registers."""
+        self.write("*CLS")
+    
+    def resync(self) -> None:
+        """
+        Recover from a timed-out exchange.
+        
+        Clears the status registers and discards any replies that arrived
+        late, so the next query is answered with its own reply.
+        """
+        self.clear_status()
+        self._drain_input()
+    
+    def get_operation_complete(self) -> bool:
+        """Check if operation is complete."""
+        return self.query("*OPC?") == "1"
+    
+    def wait_for_operation_complete(self) -> None:
+        """Wait for operation to complete."""
+        self.write("*WAI")
+    
+    def wait_for_opc(self, timeout: float = 5.0, poll_interval: float = 0.05) -> None:
+        """
+        Poll *OPC? until pending operations have completed.
+        
+        Args:
+            timeout (float): Maximum time to wait in seconds
+            poll_interval (float): Delay between polls in seconds
+        
+        Raises:
+            OwonPSUError: If operations are still pending after the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if self.get_operation_complete():
+                    return
+            except OwonPSUError as e:
+                # A busy device (e.g. during *RST) may not answer in time
+                logger.debug(f"*OPC? poll failed: {e}")
+            if time.monotonic() >= deadline:
+                raise OwonPSUError(f"Operation not complete after {timeout:.1f}s")
+            time.sleep(poll_interval)
+    
+    # ============================================================================
+    # OUTPUT CONTROL
+    # ============================================================================
+    
+    def set_output(self, state: bool) -> None:
+        """
+        Enable or disable the output.
+        
+        Args:
+            state (bool): True to enable output, False to disable
+        """
+        command = "OUTPut ON" if state else "OUTPut OFF"
+        self.write(command)
+    
+    def get_output(self) -> bool:
+        """
+        Get the current output state.
+        
+        Returns:
+            bool: True if output is enabled, False otherwise
+        """
+        response = self.query("OUTPut?")
+        return response == "1" or response == "ON"
+    
+    # ============================================================================
+    # VOLTAGE CONTROL
+    # ============================================================================
+    
+    def set_voltage(self, voltage: float) -> None:
+        """
+        Set the output voltage.
+        
+        Args:
+            voltage (float): Voltage in volts
+        """
+        self.write(f"VOLTage {voltage:.3f}")
+    
+    def get_voltage(self) -> float:
+        """
+        Get the set voltage.
+        
+        Returns:
+            float: Set voltage in volts
+        """
+        return float(self.query("VOLTage?"))
+    
+    def measure_voltage(self) -> float:
+        """
+        Measure the actual output voltage.
+        
+        Returns:
+            float: Measured voltage in volts
+        """
+        return float(self.query("MEASure:VOLTage?"))
+    
+    def set_voltage_limit(self, voltage: float) -> None:
+        """
+        Set the voltage limit.
+        
+        Args:
+            voltage (float): Voltage limit in volts
+        """
+        self.write(f"VOLTage:LIMit {voltage:.3f}")
+    
+    def get_voltage_limit(self) -> float:
+        """
+        Get the voltage limit (cached for LIMIT_CACHE_TTL seconds).
+        
+        Returns:
+            float: Voltage limit in volts
+        """
+        return float(self.query("VOLTage:LIMit?", cache_ttl=self.LIMIT_CACHE_TTL))
+    
+    # ============================================================================
+    # CURRENT CONTROL
+    # ============================================================================
+    
+    def set_current(self, current: float) -> None:
+        """
+        Set the output current.
+        
+        Args:
+            current (float): Current in amperes
+        """
+        self.write(f"CURRent {current:.3f}")
+    
+    def get_current(self) -> float:
+        """
+        Get the set current.
+        
+        Returns:
+            float: Set current in amperes
+        """
+        return float(self.query("CURRent?"))
+    
+    def measure_current(self) -> float:
+        """
+        Measure the actual output current.
+        
+        Returns:
+            float: Measured current in amperes
+        """
+        return float(self.query("MEASure:CURRent?"))
+    
+    def set_current_limit(self, current: float) -> None:
+        """
+        Set the current limit.
+        
+        Args:
+            current (float): Current limit in amperes
+        """
+        self.write(f"CURRent:LIMit {current:.3f}")
+    
+    def get_current_limit(self) -> float:
+        """
+        Get the current limit (cached for LIMIT_CACHE_TTL seconds).
+        
+        Returns:
+            float: Current limit in amperes
+        """
+        return float(self.query("CURRent:LIMit?", cache_ttl=self.LIMIT_CACHE_TTL))
+    
+    # ============================================================================
+    # MEASUREMENT COMMANDS
+    # ============================================================================
+    
+    def measure_power(self) -> float:
+        """
+        Measure the output power.
+        
+        Returns:
+            float: Power in watts
+        """
+        return float(self.query("MEASure:POWer?"))
+    
+    def get_measurement_status(self) -> Measurement:
+        """
+        Get comprehensive measurement status in a single round-trip.
+        
+        The measurement and setting queries are chained into one SCPI
+        command (separated by ';:') and the semicolon-delimited reply is
+        parsed into a Measurement; devices without compound command support
+        are queried one value at a time (see query_multi()).
+        
+        Returns:
+            Measurement: Voltage, current, power, output state and set values
+        
+        Raises:
+            OwonPSUError: If the reply does not contain one value per query
+        """
+        values = self.query_multi(["MEASure:VOLTage?", "MEASure:CURRent?", "MEASure:POWer?",
+                                   "OUTPut?", "VOLTage?", "CURRent?"])
+        voltage, current, power, output, set_voltage, set_current = values
+        try:
+            # float() accepts SCPI NR2/NR3 numbers
+            return Measurement(
+                voltage=float(voltage),
+                current=float(current),
+                power=float(power),
+                output_enabled=output == "1" or output == "ON",
+                set_voltage=float(set_voltage),
+                set_current=float(set_current)
+            )
+        except ValueError:
+            raise OwonPSUError(f"Unexpected status response: {';'.join(values)}")
+    
+    # ============================================================================
+    # SYSTEM CONTROL
+    # ============================================================================
+    
+    def set_remote_mode(self, enabled: bool) -> None:
+        """
+        Set remote/local mode.
+        
+        Args:
+            enabled (bool): True for remote mode, False for local mode
+        """
+        command = "SYSTem:REMote" if enabled else "SYSTem:LOCal"
+        self.write(command)
+    
+    def get_remote_mode(self) -> bool:
+        """
+        Get remote/local mode status (cached for MODE_CACHE_TTL seconds).
+        
+        Returns:
+            bool: True if in remote mode, False if in local mode
+        """
+        try:
+            response = self.query("SYSTem:REMote?", cache_ttl=self.MODE_CACHE_TTL)
+            return response == "1"
+        except OwonPSUError as e:
+            if "timed out" in str(e).lower():
+                logger.warning("SYSTem:REMote? command timed out - command may not be supported by this device")
+                return False  # Default to local mode if query fails
+            else:
+                raise  # Re-raise other errors
+    
+    def set_keylock(self, enabled: bool) -> None:
+        """
+        Set keylock (front panel lock) state.
+        
+        Args:
+            enabled (bool): True to enable keylock, False to disable
+        """
+        command = "SYSTem:KEYLock ON" if enabled else "SYSTem:KEYLock OFF"
+        self.write(command)
+    
+    def get_keylock(self) -> bool:
+        """
+        Get keylock state (cached for MODE_CACHE_TTL seconds).
+        
+        Returns:
+            bool: True if keylock is enabled, False otherwise
+        """
+        try:
+            response = self.query("SYSTem:KEYLock?", cache_ttl=self.MODE_CACHE_TTL)
+            return response == "1"
+        except OwonPSUError as e:
+            if "timed out" in str(e).lower():
+                logger.warning("SYSTem:KEYLock? command timed out - command may not be supported by this device")
+                return False  # Default to unlocked if query fails
+            else:
+                raise  # Re-raise other errors
+    
+    # ============================================================================
+    # STATUS AND ERROR HANDLING
+    # ============================================================================
+    
+    def get_status_byte(self) -> int:
+        """
+        Get the status byte.
+        
+        Returns:
+            int: Status byte value
+        """
+        return int(self.query("*STB?"))
+    
+    def get_error_queue(self, max_errors: int = 16) -> list:
+        """
+        Get the error queue.
+        
+        Reading stops at the first "no error" entry (error code 0, in any of
+        the formats devices use), on a failed query, or after max_errors
+        entries for devices that never report an empty queue.
+        
+        Args:
+            max_errors (int): Maximum number of entries to read
+        
+        Returns:
+            list: List of error messages
+        """
+        errors = []
+        for _ in range(max_errors):
+            try:
+                error = self.query("SYSTem:ERRor?")
+            except OwonPSUError:
+                break
+            if not error or _is_no_error(error):
+                break
+            errors.append(error)
+        else:
+            logger.warning(f"Error queue still not empty after {max_errors} entries; remaining entries not read")
+        return errors
+    
+    def clear_error_queue(self) -> None:
+        """Clear the error queue."""
+        self.write("*CLS")
+    
+    # ============================================================================
+    # CONVENIENCE METHODS
+    # ============================================================================
+    
+    def configure_output(self, voltage: float, current: float, enable: bool = True) -> None:
+        """
+        Configure output with voltage, current, and enable state.
+        
+        Args:
+            voltage (float): Output voltage in volts
+            current (float): Output current in amperes
+            enable (bool): Whether to enable output
+        """
+        commands = [f"VOLTage {voltage:.3f}", f"CURRent {current:.3f}"]
+        if enable:
+            commands.append("OUTPut ON")
+        self.write_many(commands)
+    
+    def safe_shutdown(self) -> None:
+        """Safely shutdown the PSU by disabling output and setting voltage to 0."""
+        self.set_output(False)
+        self.set_voltage(0.0)
+        time.sleep(0.1)
+    
+    def get_device_info(self) -> dict:
+        """
+        Get comprehensive device information.
+        
+        Identity and limits come from the query cache; output state, status
+        byte and error queue are read from the device on every call.
+        
+        Returns:
+            dict: Device information including identity, limits, and status
+        """
+        info = {
+            'identity': self.get_identity(),
+            'output_enabled': self.get_output(),
+        }
+        
+        # Try to get additional info, but don't fail if commands timeout
+        try:
+            info['voltage_limit'] = self.get_voltage_limit()
+        except OwonPSUError as e:
+            if "timed out" in str(e).lower():
+                logger.warning("VOLTage:LIMit? command timed out")
+                info['voltage_limit'] = None
+            else:
+                raise
+                
+        try:
+            info['current_limit'] = self.get_current_limit()
+        except OwonPSUError as e:
+            if "timed out" in str(e).lower():
+                logger.warning("CURRent:LIMit? command timed out")
+                info['current_limit'] = None
+            else:
+                raise
+                
+        try:
+            info['remote_mode'] = self.get_remote_mode()
+        except OwonPSUError as e:
+            if "timed out" in str(e).lower():
+                logger.warning("SYSTem:REMote? command timed out")
+                info['remote_mode'] = None
+            else:
+                raise
+                
+        try:
+            info['keylock'] = self.get_keylock()
+        except OwonPSUError as e:
+            if "timed out" in str(e).lower():
+                logger.warning("SYSTem:KEYLock? command timed out")
+                info['keylock'] = None
+            else:
+                raise
+                
+        try:
+            info['status_byte'] = self.get_status_byte()
+        except OwonPSUError as e:
+            if "timed out" in str(e).lower():
+                logger.warning("*STB? command timed out")
+                info['status_byte'] = None
+            else:
+                raise
+                
+        try:
+            info['errors'] = self.get_error_queue()
+        except OwonPSUError as e:
+            if "timed out" in str(e).lower():
+                logger.warning("SYSTem:ERRor? command timed out")
+                info['errors'] = []
+            else:
+                raise
+                
+        return info
+    
+    def is_connected(self) -> bool:
+        """
+        Check if connected to the PSU.
+        
+        Returns:
+            bool: True if connected, False otherwise
+        """
+        return self._connected and self.connection is not None
+
+
+# ============================================================================
+# EXAMPLE USAGE
+# ============================================================================
+
+if __name__ == "__main__":
+    import sys
+    
+    if len(sys.argv) < 2:
+        print("Usage: python -m owon_psu.psu <serial_port>")
+        print("Example: python -m owon_psu.psu COM3")
+        sys.exit(1)
+    
+    port_name = sys.argv[1]
+    
+    try:
+        # Example with context manager
+        with OwonPSU(port_name) as psu:
+            print("Device Identity:", psu.get_identity())
+            print("Device Info:", psu.get_device_info())
+            
+            # Configure and enable output
+            psu.configure_output(voltage=12.0, current=1.0, enable=True)
+            
+            # Monitor for a few seconds
+            for i in range(5):
+                status = psu.get_measurement_status()
+                print(f"Status {i+1}: {status}")
+                time.sleep(1)
+            
+            # Safe shutdown
+            psu.safe_shutdown()
+            
+    except OwonPSUError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
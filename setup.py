@@ -4,6 +4,7 @@ Setup script for OWON PSU Control Library
 """
 
 from setuptools import setup, find_packages
+import ast
 import os
 
 # Read the README file for long description
@@ -14,13 +15,15 @@ def read_readme():
             return f.read()
     return "OWON PSU Control Library"
 
-# Read version from the package
+# Read version from the package without importing it
 def get_version():
     version_file = os.path.join(os.path.dirname(__file__), 'owon_psu', '__init__.py')
     with open(version_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.startswith('__version__'):
-                return line.split('=')[1].strip().strip("'\"")
+        tree = ast.parse(f.read(), version_file)
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and node.targets[0].id == '__version__'):
+            return ast.literal_eval(node.value)
     return '1.0.0'
 
 setup(
@@ -4,25 +4,19 @@ Test script to verify owon_psu module access
 """
 
 import sys
-import os
-
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 def test_module_import():
     """Test that the owon_psu module can be imported."""
-    try:
-        from owon_psu import OwonPSU, OwonPSUError
-        print("✅ Successfully imported owon_psu module")
-        print(f"   - OwonPSU class: {OwonPSU}")
-        print(f"   - OwonPSUError class: {OwonPSUError}")
-        return True
-    except ImportError as e:
-        print(f"❌ Failed to import owon_psu module: {e}")
-        return False
+    from owon_psu import OwonPSU, OwonPSUError
+    print("\n".join([
+        "✅ Successfully imported owon_psu module",
+        f"   - OwonPSU class: {OwonPSU}",
+        f"   - OwonPSUError class: {OwonPSUError}",
+    ]))
 
 def test_module_attributes():
     """Test that the module has the expected attributes."""
+    out = []
     try:
         from owon_psu import OwonPSU
         
@@ -35,11 +29,8 @@ def test_module_attributes():
         ]
         
         for attr in expected_attrs:
-            if hasattr(OwonPSU, attr):
-                print(f"✅ Found attribute: {attr}")
-            else:
-                print(f"❌ Missing attribute: {attr}")
-                return False
+            assert hasattr(OwonPSU, attr), f"Missing attribute: {attr}"
+            out.append(f"✅ Found attribute: {attr}")
         
         # Test method existence
         expected_methods = [
@@ -59,27 +50,16 @@ def test_module_attributes():
         ]
         
         for method in expected_methods:
-            if hasattr(OwonPSU, method):
-                print(f"✅ Found method: {method}")
-            else:
-                print(f"❌ Missing method: {method}")
-                return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error testing module attributes: {e}")
-        return False
+            assert hasattr(OwonPSU, method), f"Missing method: {method}"
+            out.append(f"✅ Found method: {method}")
+    finally:
+        if out:
+            print("\n".join(out))
 
 def test_version():
     """Test that the module has a version."""
-    try:
-        from owon_psu import __version__
-        print(f"✅ Module version: {__version__}")
-        return True
-    except ImportError:
-        print("❌ No version found in module")
-        return False
+    from owon_psu import __version__
+    print(f"✅ Module version: {__version__}")
 
 def main():
     """Run all tests."""
@@ -97,10 +77,11 @@ def main():
     
     for test_name, test_func in tests:
         print(f"\n--- {test_name} ---")
-        if test_func():
+        try:
+            test_func()
             passed += 1
-        else:
-            print(f"❌ {test_name} failed")
+        except Exception as e:
+            print(f"❌ {test_name} failed: {e}")
     
     print("\n" + "=" * 40)
     print(f"Tests passed: {passed}/{total}")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Protocol tests for owon_psu, run against a fake device on a socket pair
+"""
+
+import socket
+import sys
+import threading
+
+def _connected_psu(answer=None):
+    """
+    Return an OwonPSU wired to one end of a socket pair, and the other end.
+    
+    If answer is given, a thread plays the device: it calls answer() with each
+    command line received and sends back the reply it returns, if any. The
+    lines are also collected in the received list returned last.
+    """
+    from owon_psu import OwonPSU
+    
+    psu_end, device_end = socket.socketpair()
+    psu_end.settimeout(1.0)
+    psu = OwonPSU('socketpair', serial=False, timeout=1.0)
+    psu.connection = psu_end
+    psu._connected = True
+    psu._connection_type = 'network'
+    
+    received = []
+    if answer is not None:
+        def serve():
+            with device_end.makefile('rwb') as stream:
+                for line in stream:
+                    command = line.decode().strip()
+                    received.append(command)
+                    reply = answer(command)
+                    if reply is not None:
+                        stream.write(reply.encode() + b'\n')
+                        stream.flush()
+        threading.Thread(target=serve, daemon=True).start()
+    return psu, device_end, received
+
+def test_reply_split_across_reads():
+    """Test that a reply arriving in two pieces is read as one line."""
+    psu, device_end, _ = _connected_psu()
+    try:
+        device_end.sendall(b'12.')
+        timer = threading.Timer(0.05, device_end.sendall, [b'000\n'])
+        timer.start()
+        assert psu._readline_network() == b'12.000'
+        timer.join()
+    finally:
+        psu.close()
+        device_end.close()
+
+def test_two_replies_in_one_read():
+    """Test that two replies received together are returned one per call."""
+    psu, device_end, _ = _connected_psu()
+    try:
+        device_end.sendall(b'12.000\n1.000\n')
+        assert psu._readline_network() == b'12.000'
+        assert psu._readline_network() == b'1.000'
+        assert not psu._rx_buf
+    finally:
+        psu.close()
+        device_end.close()
+
+def test_query_multi_falls_back_to_single_queries():
+    """Test that a rejected compound query is retried one command at a time."""
+    replies = {'VOLTage?': '12.000', 'CURRent?': '1.000'}
+    psu, device_end, received = _connected_psu(
+        lambda command: 'ERR' if ';' in command else replies.get(command))
+    try:
+        assert psu.query_multi(['VOLTage?', 'CURRent?']) == ['12.000', '1.000']
+        assert psu._supports_concat is False
+        assert received == ['VOLTage?;:CURRent?', 'VOLTage?', 'CURRent?']
+        
+        # Later calls skip the compound attempt
+        assert psu.query_multi(['VOLTage?', 'CURRent?']) == ['12.000', '1.000']
+        assert received[3:] == ['VOLTage?', 'CURRent?']
+    finally:
+        psu.close()
+        device_end.close()
+
+def test_daemon_round_trip():
+    """Test a request and an error reply through the CLI daemon protocol."""
+    from owon_psu import Measurement, OwonPSUError
+    from owon_psu.cli import DaemonClient, _handle_daemon_client
+    
+    class FakePSU:
+        def get_identity(self):
+            return 'OWON,SPE6103,123,FV1.0'
+        
+        def get_measurement_status(self):
+            return Measurement(12.0, 0.5, 6.0, True, 12.0, 1.0)
+    
+    server_end, client_end = socket.socketpair()
+    handler = threading.Thread(target=_handle_daemon_client, args=(FakePSU(), server_end),
+                               daemon=True)
+    handler.start()
+    with DaemonClient(client_end) as client:
+        assert client.get_identity() == 'OWON,SPE6103,123,FV1.0'
+        status = client.get_measurement_status()
+        assert isinstance(status, Measurement)
+        assert status.output_enabled is True
+        assert status['voltage'] == 12.0
+        
+        try:
+            client.call('open_network', '127.0.0.1', 3000)
+        except OwonPSUError as e:
+            assert 'not served' in str(e)
+        else:
+            raise AssertionError("Daemon served a method outside DAEMON_METHODS")
+    handler.join(1.0)
+    assert not handler.is_alive()
+    server_end.close()
+
+def main():
+    """Run all tests."""
+    tests = [
+        test_reply_split_across_reads,
+        test_two_replies_in_one_read,
+        test_query_multi_falls_back_to_single_queries,
+        test_daemon_round_trip,
+    ]
+    
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_func.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test_func.__name__} failed: {e!r}")
+    
+    print(f"Tests passed: {len(tests) - failed}/{len(tests)}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())